@@ -2,45 +2,212 @@
 EDINET API接続クライアント
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import functools
+import threading
 import time
-from typing import Dict, List, Optional, Any
+import os
+from collections import OrderedDict
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Any, Iterable, Iterator, Tuple
 from datetime import datetime, date
+from email.utils import parsedate_to_datetime
 import logging
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson未導入時は標準ライブラリで代替
+    import json
+    
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode("utf-8"))
+
+# brotliが導入されている場合のみbr圧縮を受け付ける（展開はurllib3が行う）
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 from ..config import (
     EDINET_DOCUMENTS_URL, 
     EDINET_DOCUMENT_URL, 
     API_KEY,
     DOCUMENT_TYPES,
-    FILE_TYPES
+    FILE_TYPES,
+    DEFAULT_CACHE_DIR,
+    DOCUMENTS_CACHE_EXPIRE_DAYS
 )
 
 # ログ設定
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 接続・読み込みタイムアウト（秒）
+REQUEST_TIMEOUT = (5, 30)
+DOWNLOAD_TIMEOUT = (5, 60)
+
+# ダウンロード時の書き込み単位（バイト）
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# 一括ダウンロード時の保存ファイル名の末尾（ファイル形式ごと。未定義の形式は _{形式}.zip）
+_FILE_TYPE_SUFFIXES = {
+    FILE_TYPES["ZIP"]: ".zip",
+    FILE_TYPES["PDF"]: ".pdf",
+    FILE_TYPES["CSV"]: "_csv.zip",
+}
+
+# 条件付きGET用に保持する文書一覧の最大件数（古いものから破棄）
+CONDITIONAL_CACHE_SIZE = 32
+
+# 取得対象の様式コードと書類種別
+_FORM_TO_KIND = {
+    '030000': "有価証券報告書",  # 有価証券報告書（年次）
+    '043000': "四半期報告書",    # 四半期報告書（第1四半期）※2024年4月以降廃止
+    '044000': "四半期報告書",    # 四半期報告書（第2四半期）※2024年4月以降廃止
+    '045000': "四半期報告書",    # 四半期報告書（第3四半期）※2024年4月以降廃止
+    '050000': "半期報告書",      # 半期報告書
+}
+_SECURITIES_REPORT_FORMS = frozenset(_FORM_TO_KIND)
+
+# フィルタリングで参照する項目（府令コード、様式コード、書類情報修正区分）
+_FILTER_KEYS = itemgetter("ordinanceCode", "formCode", "docInfoEditStatus")
+
+
+class _RateLimiter:
+    """トークンバケット方式のレート制限（スレッド間で共有可能）"""
+    
+    def __init__(self, qps: float):
+        """
+        初期化
+        
+        Args:
+            qps: 1秒あたりの最大リクエスト数
+        """
+        self._interval = 1.0 / qps
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        
+    def wait(self) -> None:
+        """次の送信枠まで待機（枠の予約のみロックし、待機はロック外で行う）"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self._interval
+        
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+            
+    def defer(self, seconds: float) -> None:
+        """サーバーから待機を指示された場合、以降の送信枠を後ろ倒しする"""
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-Afterヘッダーを待機秒数に変換
+    
+    Args:
+        value: ヘッダー値（秒数またはHTTP日付）
+        
+    Returns:
+        待機秒数（解釈できない場合はNone）
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    return max(0.0, retry_at.timestamp() - time.time())
+
 
 class EdinetAPIClient:
-    """EDINET API クライアント"""
+    """
+    EDINET API クライアント
     
-    def __init__(self, api_key: str = None):
+    接続プールを使い回すため、複数のリクエストはひとつのインスタンスで行う:
+    
+        with EdinetAPIClient() as client:
+            ...
+    """
+    
+    def __init__(self, 
+                 api_key: str = None, 
+                 qps: float = 1.0,
+                 cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
         """
         初期化
         
         Args:
             api_key: APIキー（未指定の場合は環境変数から取得）
+            qps: 1秒あたりの最大リクエスト数（レート制限対策）
+            cache_dir: 文書一覧のキャッシュ保存先（Noneの場合はキャッシュしない）
         """
         self.api_key = api_key or API_KEY
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.session = requests.Session()
-        self.rate_limit_delay = 1  # レート制限対策（秒）
         
-    def _make_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
+        # 接続プールと再試行（一時的な429/5xxはurllib3側でバックオフ）
+        retry = Retry(
+            total=5,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={"GET"},
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": "edinet_downloader/1.0",
+            "Accept-Encoding": _ACCEPT_ENCODING
+        })
+        
+        self._rate_limiter = _RateLimiter(qps)
+        
+        # 条件付きGET用の検証子（ETag, Last-Modified）と前回の取得結果（キー: (日付, 文書種別)）
+        # ディスクキャッシュ対象外の日付のみ、直近CONDITIONAL_CACHE_SIZE件まで保持する
+        self._conditional_cache: "OrderedDict[Tuple[str, int], Tuple[Optional[str], Optional[str], Any]]" = OrderedDict()
+        self._conditional_lock = threading.Lock()
+        
+    def __enter__(self) -> "EdinetAPIClient":
+        return self
+        
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        
+    def close(self) -> None:
+        """セッションを閉じて接続プールを解放"""
+        self.session.close()
+        
+    def _make_request(self, 
+                      url: str, 
+                      params: Dict[str, Any],
+                      stream: bool = False,
+                      timeout: tuple = REQUEST_TIMEOUT,
+                      headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """
         APIリクエストを実行
         
         Args:
             url: リクエストURL
             params: リクエストパラメータ
+            stream: レスポンス本文を逐次読み込みするか
+            timeout: 接続・読み込みタイムアウト（秒）
+            headers: 追加のリクエストヘッダー
             
         Returns:
             レスポンス
@@ -48,12 +215,24 @@ class EdinetAPIClient:
         # APIキーを追加
         params["Subscription-Key"] = self.api_key
         
+        # レート制限対策（前回送信からの経過時間を差し引いた分だけ待機）
+        self._rate_limiter.wait()
+        
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
+            response = self.session.get(url, params=params, headers=headers, stream=stream, timeout=timeout)
             
-            # レート制限対策
-            time.sleep(self.rate_limit_delay)
+            # 再試行後も429の場合はRetry-Afterに従い、全スレッドの送信を遅らせて1回だけ再送
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None:
+                    logger.warning(f"レート制限超過: {retry_after:.1f}秒後に再試行します")
+                    # 逐次読み込みの応答は閉じないと接続がプールに戻らないため、待機前に解放
+                    response.close()
+                    self._rate_limiter.defer(retry_after)
+                    self._rate_limiter.wait()
+                    response = self.session.get(url, params=params, headers=headers, stream=stream, timeout=timeout)
+            
+            response.raise_for_status()
             
             return response
             
@@ -61,37 +240,270 @@ class EdinetAPIClient:
             logger.error(f"APIリクエストエラー: {e}")
             raise
             
+    def _documents_cache_path(self, target_date: date, doc_type: int) -> Optional[Path]:
+        """
+        文書一覧のキャッシュファイルパスを取得
+        
+        Args:
+            target_date: 対象日付
+            doc_type: 文書種別
+            
+        Returns:
+            キャッシュファイルパス（当日以降など、キャッシュ対象外の場合はNone）
+        """
+        # 当日以降の一覧は追加提出で変わるためキャッシュしない
+        if self.cache_dir is None or target_date >= date.today():
+            return None
+        
+        return self.cache_dir / "documents" / f"{target_date.isoformat()}_{doc_type}.json"
+        
+    def _read_documents_cache(self, cache_path: Path) -> Optional[bytes]:
+        """有効期限内のキャッシュを読み込み（存在しない・期限切れの場合はNone）"""
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        
+        if age > DOCUMENTS_CACHE_EXPIRE_DAYS * 86400:
+            return None
+        
+        return cache_path.read_bytes()
+        
+    def _write_documents_cache(self, cache_path: Path, content: bytes) -> None:
+        """キャッシュを書き込み（書き込み途中のファイルを読まないよう置き換えで反映）"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"キャッシュ書き込みエラー: {e}")
+            
+    def _remember_conditional(self, 
+                              key: Tuple[str, int], 
+                              etag: Optional[str], 
+                              last_modified: Optional[str], 
+                              data: Any) -> None:
+        """条件付きGET用の検証子と取得結果を保持（上限を超えたら最も古いものを破棄）"""
+        with self._conditional_lock:
+            self._conditional_cache[key] = (etag, last_modified, data)
+            self._conditional_cache.move_to_end(key)
+            while len(self._conditional_cache) > CONDITIONAL_CACHE_SIZE:
+                self._conditional_cache.popitem(last=False)
+            
     def get_documents_list(self, 
                           target_date: date, 
-                          doc_type: int = DOCUMENT_TYPES["有価証券報告書"]) -> List[Dict[str, Any]]:
+                          doc_type: int = DOCUMENT_TYPES["有価証券報告書"],
+                          bypass_cache: bool = False) -> List[Dict[str, Any]]:
         """
         指定日の文書リストを取得
         
         Args:
             target_date: 対象日付
             doc_type: 文書種別
+            bypass_cache: Trueの場合はキャッシュを使わずAPIから取得
             
         Returns:
             文書リスト
         """
         params = {
-            "date": target_date.strftime("%Y-%m-%d"),
+            "date": target_date.isoformat(),
             "type": doc_type
         }
         
-        response = self._make_request(EDINET_DOCUMENTS_URL, params)
-        data = response.json()
+        cache_path = self._documents_cache_path(target_date, doc_type)
+        content = None
+        if cache_path is not None and not bypass_cache:
+            content = self._read_documents_cache(cache_path)
+        
+        if content is None:
+            # 前回の検証子があれば条件付きGETで送信し、未更新(304)なら前回の結果を再利用
+            key = (params["date"], doc_type)
+            headers = {"Accept": "application/json"}
+            with self._conditional_lock:
+                cached = self._conditional_cache.get(key)
+            if cached is not None:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+            
+            response = self._make_request(EDINET_DOCUMENTS_URL, params, headers=headers)
+            
+            if response.status_code == 304 and cached is not None:
+                data = cached[2]
+                with self._conditional_lock:
+                    if key in self._conditional_cache:
+                        self._conditional_cache.move_to_end(key)
+            else:
+                content = response.content
+                data = _loads(content)
+                if cache_path is not None and "results" in data:
+                    self._write_documents_cache(cache_path, content)
+                
+                # ディスクにキャッシュされる日付は再取得しないため、検証子と結果は保持しない
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if cache_path is None and (etag or last_modified):
+                    self._remember_conditional(key, etag, last_modified, data)
+        else:
+            data = _loads(content)
         
         if "results" in data:
-            logger.info(f"{target_date}: {len(data['results'])}件の文書を取得")
+            logger.info("%s: %d件の文書を取得", target_date, len(data["results"]))
             return data["results"]
         else:
-            logger.warning(f"{target_date}: 文書が見つかりませんでした")
+            logger.warning("%s: 文書が見つかりませんでした", target_date)
             return []
             
+    def get_documents_lists(self, 
+                           dates: Iterable[date], 
+                           doc_type: int = DOCUMENT_TYPES["有価証券報告書"],
+                           max_workers: int = 8,
+                           fetch: Optional[Callable[[date], List[Dict[str, Any]]]] = None
+                           ) -> Iterator[Tuple[date, "Future[List[Dict[str, Any]]]"]]:
+        """
+        複数日の文書リストの取得を並列に開始（レート制限はクライアント全体で共有）
+        
+        Future.result()で文書リストを取得する（取得時の例外もそこで送出される）。
+        呼び出し側が途中で反復を終えた場合、未実行の取得は取り消す。
+        
+        Args:
+            dates: 対象日付
+            doc_type: 文書種別
+            max_workers: 同時実行数
+            fetch: 1日分の取得処理（省略時はget_documents_list。指定時はdoc_typeを使わない）
+            
+        Yields:
+            (対象日付, 文書リストのFuture)（日付の順）
+        """
+        if fetch is None:
+            fetch = functools.partial(self.get_documents_list, doc_type=doc_type)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [(target_date, executor.submit(fetch, target_date)) for target_date in dates]
+            yield from futures
+        finally:
+            # 途中で打ち切られた場合は未実行のリクエストを破棄
+            executor.shutdown(wait=True, cancel_futures=True)
+            
+    def get_documents_list_range(self, 
+                                 start_date: date, 
+                                 end_date: date,
+                                 doc_type: int = DOCUMENT_TYPES["有価証券報告書"],
+                                 max_workers: int = 8
+                                 ) -> Tuple[Dict[date, List[Dict[str, Any]]], Dict[date, Exception]]:
+        """
+        期間内の各日の文書リストをまとめて取得
+        
+        EDINET APIには期間指定の一覧取得がないため、日ごとのリクエストを
+        同一セッション（接続を使い回す）上で並列に発行する。
+        
+        Args:
+            start_date: 開始日
+            end_date: 終了日（この日を含む）
+            doc_type: 文書種別
+            max_workers: 同時実行数
+            
+        Returns:
+            ({対象日付: 文書リスト}, {取得に失敗した日付: 例外})（いずれも日付順）
+        """
+        dates = [date.fromordinal(o) for o in range(start_date.toordinal(), end_date.toordinal() + 1)]
+        results: Dict[date, List[Dict[str, Any]]] = {}
+        errors: Dict[date, Exception] = {}
+        
+        for target_date, future in self.get_documents_lists(dates, doc_type, max_workers):
+            try:
+                results[target_date] = future.result()
+            except Exception as e:
+                logger.warning("文書リスト取得エラー (%s): %s", target_date.isoformat(), e)
+                errors[target_date] = e
+                
+        return results, errors
+            
     def download_document(self, 
                          doc_id: str, 
-                         file_type: int = FILE_TYPES["ZIP"]) -> bytes:
+                         dest_path: str,
+                         file_type: int = FILE_TYPES["ZIP"]) -> str:
+        """
+        文書をダウンロードしてファイルに保存（全体をメモリに載せずに逐次書き込み）
+        
+        一時ファイルへ書き込んでから置き換えるため、途中で失敗しても保存先に不完全なファイルは残らない。
+        
+        Args:
+            doc_id: 文書ID
+            dest_path: 保存先パス
+            file_type: ファイル形式
+            
+        Returns:
+            保存先パス
+        """
+        url = f"{EDINET_DOCUMENT_URL}/{doc_id}"
+        params = {"type": file_type}
+        
+        with self._make_request(url, params, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code != 200:
+                logger.error(f"文書 {doc_id} のダウンロードに失敗しました")
+                raise Exception(f"ダウンロード失敗: {response.status_code}")
+            
+            tmp_path = Path(dest_path).with_name(f"{Path(dest_path).name}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                os.replace(tmp_path, dest_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        
+        logger.info(f"文書 {doc_id} をダウンロードしました")
+        return str(dest_path)
+        
+    def download_many(self, 
+                      doc_ids: Iterable[str], 
+                      dest_dir: str,
+                      file_type: int = FILE_TYPES["ZIP"],
+                      max_workers: int = 8) -> Dict[str, str]:
+        """
+        複数の文書を並列にダウンロード（レート制限はクライアント全体で共有）
+        
+        Args:
+            doc_ids: 文書IDのリスト
+            dest_dir: 保存先フォルダ（ZIPは{文書ID}.zip、PDFは{文書ID}.pdf、CSVは{文書ID}_csv.zip として保存）
+            file_type: ファイル形式
+            max_workers: 同時実行数
+            
+        Returns:
+            文書ID→保存先パスの辞書（失敗した文書は含まない）
+        """
+        dest_dir = Path(dest_dir)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        
+        suffix = _FILE_TYPE_SUFFIXES.get(file_type, f"_{file_type}.zip")
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.download_document, doc_id, dest_dir / f"{doc_id}{suffix}", file_type): doc_id
+                for doc_id in doc_ids
+            }
+            for future in as_completed(futures):
+                doc_id = futures[future]
+                try:
+                    results[doc_id] = future.result()
+                except Exception as e:
+                    logger.error(f"文書 {doc_id} のダウンロードエラー: {e}")
+        
+        return results
+        
+    def download_document_bytes(self, 
+                               doc_id: str, 
+                               file_type: int = FILE_TYPES["ZIP"]) -> bytearray:
         """
         文書をダウンロード
         
@@ -100,63 +512,82 @@ class EdinetAPIClient:
             file_type: ファイル形式
             
         Returns:
-            文書データ（バイナリ）
+            文書データ（コピーを避けるためbytesに変換せずbytearrayのまま返す）
         """
         url = f"{EDINET_DOCUMENT_URL}/{doc_id}"
         params = {"type": file_type}
         
-        response = self._make_request(url, params)
+        with self._make_request(url, params, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code != 200:
+                logger.error(f"文書 {doc_id} のダウンロードに失敗しました")
+                raise Exception(f"ダウンロード失敗: {response.status_code}")
+            
+            # 圧縮転送時のContent-Lengthは圧縮後のサイズのため、非圧縮時のみ事前に確保する
+            content_length = int(response.headers.get("Content-Length", "0") or 0)
+            if response.headers.get("Content-Encoding"):
+                content_length = 0
+            
+            # 確保済みの領域を先頭から埋める（超過分は末尾に追加され、余りは最後に切り詰める）
+            buf = bytearray(content_length)
+            offset = 0
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                buf[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+            del buf[offset:]
         
-        if response.status_code == 200:
-            logger.info(f"文書 {doc_id} をダウンロードしました")
-            return response.content
-        else:
-            logger.error(f"文書 {doc_id} のダウンロードに失敗しました")
-            raise Exception(f"ダウンロード失敗: {response.status_code}")
+        logger.info(f"文書 {doc_id} をダウンロードしました")
+        return buf
             
-    def filter_securities_reports(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def filter_securities_reports(self, 
+                                  documents: List[Dict[str, Any]],
+                                  require_xbrl: bool = False) -> List[Dict[str, Any]]:
         """
         有価証券報告書、四半期報告書、半期報告書をフィルタリング
         
         Args:
             documents: 文書リスト
+            require_xbrl: TrueのときXBRLを含む文書（xbrlFlagが"1"）のみに絞り込む
             
         Returns:
             フィルタリング後の文書リスト
         """
-        # 取得対象の様式コード
-        SECURITIES_REPORT_FORMS = [
-            '030000',  # 有価証券報告書（年次）
-            '043000',  # 四半期報告書（第1四半期）※2024年4月以降廃止
-            '044000',  # 四半期報告書（第2四半期）※2024年4月以降廃止  
-            '045000',  # 四半期報告書（第3四半期）※2024年4月以降廃止
-            '050000',  # 半期報告書
-        ]
-        
-        filtered = []
-        
-        for doc in documents:
-            ordinance_code = doc.get("ordinanceCode")
-            form_code = doc.get("formCode")
-            edit_status = doc.get("docInfoEditStatus")
-            doc_description = doc.get("docDescription", "")
-            
-            # 有価証券報告書、四半期報告書、半期報告書のフィルタリング条件
-            if (ordinance_code == "010" and 
-                form_code in SECURITIES_REPORT_FORMS and 
-                edit_status != 2):  # 編集状態が2（削除）でない
-                
-                # 書類種別を判定
-                if form_code == '030000':
-                    doc_type = "有価証券報告書"
-                elif form_code in ['043000', '044000', '045000']:
-                    doc_type = "四半期報告書"
-                elif form_code == '050000':
-                    doc_type = "半期報告書"
-                else:
-                    doc_type = "その他報告書"
-                
-                filtered.append(doc)
-                logger.info(f"{doc_type}: {doc.get('filerName')} - {doc.get('docID')}")
+        # 有価証券報告書、四半期報告書、半期報告書のフィルタリング条件
+        # （編集状態が2（削除）でないもの。項目の取り出しはitemgetterでまとめて行う）
+        try:
+            filtered = [
+                doc for doc in documents
+                if (keys := _FILTER_KEYS(doc))[0] == "010"
+                and keys[1] in _SECURITIES_REPORT_FORMS
+                and keys[2] != 2
+            ]
+        except KeyError:
+            # 項目が欠けた文書を含む場合はget()で判定
+            filtered = [
+                doc for doc in documents
+                if doc.get("ordinanceCode") == "010"
+                and doc.get("formCode") in _SECURITIES_REPORT_FORMS
+                and doc.get("docInfoEditStatus") != 2
+            ]
+        
+        # XBRLを取得する用途では、XBRLのない文書をダウンロード前に除外
+        if require_xbrl:
+            filtered = [doc for doc in filtered if doc.get("xbrlFlag") == "1"]
+        
+        # 書類種別の判定はログ出力時のみ行う（判定結果はログにしか使わないため）
+        if logger.isEnabledFor(logging.INFO):
+            form_to_kind = _FORM_TO_KIND.get
+            for doc in filtered:
+                logger.info("%s: %s - %s", form_to_kind(doc.get("formCode"), "その他報告書"), doc.get("filerName"), doc.get("docID"))
                 
-        return filtered
\ No newline at end of file
+        return filtered
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_client() -> EdinetAPIClient:
+    """
+    スクリプト用の共有クライアントを取得（プロセス内で1つのセッションを使い回す）
+    
+    Returns:
+        EdinetAPIClient
+    """
+    return EdinetAPIClient()
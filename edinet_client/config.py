@@ -39,4 +39,8 @@ FILTER_CONDITIONS = {
 
 # 出力設定
 DEFAULT_DOWNLOAD_DIR = "./downloads"
-DEFAULT_OUTPUT_DIR = "./output"
\ No newline at end of file
+DEFAULT_OUTPUT_DIR = "./output"
+
+# キャッシュ設定（過去日の文書一覧は変わらないためディスクに保存して再利用）
+DEFAULT_CACHE_DIR = "./cache"
+DOCUMENTS_CACHE_EXPIRE_DAYS = 30
\ No newline at end of file
@@ -6,307 +6,278 @@ EDINETから取得可能な項目を分析してCSV出力（詳細説明付き
 """
 import json
 import csv
+import math
+from collections import Counter
 from datetime import datetime
 
-def analyze_edinet_fields_with_details():
-    """取得済みデータから利用可能な項目を分析（詳細説明付き）"""
-    
-    # JSONファイルを読み込み
-    with open('financial_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if not data:
-        print("データがありません")
-        return
+try:
+    import ijson
+except ImportError:  # ijson未導入時はファイル全体を読み込む
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# フィールド定義（フィールド名 → (日本語名, 詳細説明, データカテゴリ)）
+FIELD_DEFINITIONS: dict[str, tuple[str, str, str]] = {
+    "seqNumber": ("シーケンス番号", "APIレスポンス内での順序番号。1日の中での取得順を示す", "メタデータ"),
+    "docID": ("書類ID", "書類を一意に識別するID。XBRLやPDFダウンロード時にこのIDを使用する", "メタデータ"),
+    "edinetCode": ("EDINETコード", "金融庁が企業に付与する一意のコード。企業を特定する際の主キー", "企業識別"),
+    "secCode": ("証券コード", "上場企業の4桁または5桁の証券コード。東証等で使用される", "企業識別"),
+    "JCN": ("法人番号", "国税庁が付与する13桁の法人番号。日本の全法人に付与", "企業識別"),
+    "filerName": ("提出者名", "書類を提出した企業の正式名称", "企業識別"),
+    "fundCode": ("ファンドコード", "投資信託等のファンドを識別するコード。企業の場合はnull", "企業識別"),
+    "ordinanceCode": ("府令コード", "010=企業内容等開示、020=特定有価証券開示など、法的根拠を示す", "書類分類"),
+    "formCode": ("様式コード", "030000=有価証券報告書、043000=四半期報告書など、書類の様式", "書類分類"),
+    "docTypeCode": ("書類種別コード", "120=有価証券報告書、140=四半期報告書など、書類の種類", "書類分類"),
+    "periodStart": ("期間開始日", "会計期間の開始日（YYYY-MM-DD形式）。決算期間の始まり", "期間情報"),
+    "periodEnd": ("期間終了日", "会計期間の終了日（YYYY-MM-DD形式）。決算日を示す", "期間情報"),
+    "submitDateTime": ("提出日時", "EDINETに書類が提出された日時。法定開示のタイミング", "期間情報"),
+    "docDescription": ("書類の説明", "書類の内容を説明する文字列。期や期間を含む詳細情報", "書類情報"),
+    "issuerEdinetCode": ("発行者EDINETコード", "有価証券の発行者のEDINETコード。大量保有報告書等で使用", "関連企業"),
+    "subjectEdinetCode": ("対象EDINETコード", "公開買付等の対象企業のEDINETコード", "関連企業"),
+    "subsidiaryEdinetCode": ("子会社EDINETコード", "子会社のEDINETコード。連結対象を識別", "関連企業"),
+    "currentReportReason": ("臨時報告書提出事由", "臨時報告書の場合の提出理由コード", "書類情報"),
+    "parentDocID": ("親書類ID", "訂正報告書の場合の元書類ID。書類の関連性を示す", "書類情報"),
+    "opeDateTime": ("操作日時", "EDINETでの最終操作日時", "期間情報"),
+    "withdrawalStatus": ("取下区分", "0=通常、1=取下済み。取下げられた書類を識別", "ステータス"),
+    "docInfoEditStatus": ("書類情報修正区分", "0=通常、1=修正済み、2=削除。書類の修正状態", "ステータス"),
+    "disclosureStatus": ("開示不開示区分", "0=開示、1=不開示。一般公開の可否", "ステータス"),
+    "xbrlFlag": ("XBRLファイル有無", "1=あり、0=なし。財務データの構造化ファイルの有無。財務分析には必須", "ファイル情報"),
+    "pdfFlag": ("PDFファイル有無", "1=あり、0=なし。人間が読むための書類PDFの有無", "ファイル情報"),
+    "attachDocFlag": ("代替書面・添付文書有無", "1=あり、0=なし。監査報告書等の添付書類の有無", "ファイル情報"),
+    "englishDocFlag": ("英文ファイル有無", "1=あり、0=なし。英語版書類の有無", "ファイル情報"),
+    "csvFlag": ("CSVファイル有無", "1=あり、0=なし。財務データのCSV形式ファイルの有無", "ファイル情報"),
+    "legalStatus": ("縦覧区分", "1=縦覧中、0=縦覧終了。法定の縦覧期間内かどうか", "ステータス")
+}
+_DEFAULT_FIELD_DEFINITION = ("不明", "定義なし", "その他")
+
+
+def _field_kind(field_name: str) -> str:
+    """フィールド名から文字列項目の種類（date/code/flag/text）を判定"""
+    name = field_name.lower()
+    if "date" in name or "period" in name:
+        return "date"
+    elif "code" in name:
+        return "code"
+    elif "flag" in name or "status" in name:
+        return "flag"
+    else:
+        return "text"
+
+
+# 既知フィールドの種類は読み込み時に1回だけ判定しておく
+FIELD_KIND_BY_FIELD: dict[str, str] = {field_name: _field_kind(field_name) for field_name in FIELD_DEFINITIONS}
+
+# 種類ごとの推奨DB型（dateは桁数、textは最大長で決まるため対象外）
+_DB_TYPE_BY_KIND = {"code": "VARCHAR(20)", "flag": "CHAR(1)"}
+
+
+def _recommend_db_type(field_name: str, field_type: str, max_len: int) -> str:
+    """観測した型と最大文字列長からデータベース用の推奨型を決定"""
+    if field_type == "str":
+        kind = FIELD_KIND_BY_FIELD.get(field_name) or _field_kind(field_name)
+        if kind == "date":
+            return "DATE" if max_len == 10 else "DATETIME"
+        elif kind == "text":
+            return f"VARCHAR({2 ** math.ceil(math.log2(max(max_len, 1)))})"
+        return _DB_TYPE_BY_KIND[kind]
+    elif field_type == "int":
+        return "INTEGER"
+    elif field_type == "null":
+        return "VARCHAR(255)"
+    else:
+        return "TEXT"
+
+
+# キー/インデックスの推奨対象
+_INDEX_FIELDS = frozenset({"edinetCode", "secCode", "submitDateTime", "periodEnd"})
+
+# CSVのヘッダー（field_infoの各行はこの順序のタプル）
+HEADER = ("フィールド名", "日本語名", "データカテゴリ", "説明", "データ型", "推奨DB型", "キー/インデックス", "財務データ", "サンプル値", "必須")
+
+
+# 分析結果レポート（{n}: フィールド数, {out}: 保存先, {cats}: カテゴリ別項目数）
+_BAR = "=" * 70
+_REPORT_TEMPLATE = """\
+{bar}
+📊 現在取得しているデータの分析結果
+{bar}
+✅ フィールド分析完了: {n}個のフィールド
+💾 保存先: {out}
+
+📂 データカテゴリ別の項目数:
+{cats}
+
+{bar}
+⚠️  重要な注意事項
+{bar}
+現在取得しているのは「書類のメタデータ」のみです。
+実際の財務数値（売上高、利益等）は含まれていません。
+
+{bar}
+💰 実際の財務データを取得するには
+{bar}
+XBRLファイルをダウンロードして解析する必要があります：
+
+1️⃣  docIDを使用してXBRLファイルをダウンロード
+   例: https://api.edinet-fsa.go.jp/api/v2/documents/{{docID}}?type=1
+
+2️⃣  XBRLファイル内から財務データを抽出
+   取得可能な主な財務データ：
+   【損益計算書】
+     - 売上高 (NetSales)
+     - 売上原価 (CostOfSales)
+     - 営業利益 (OperatingIncome)
+     - 経常利益 (OrdinaryIncome)
+     - 当期純利益 (NetIncome)
+
+   【貸借対照表】
+     - 総資産 (TotalAssets)
+     - 流動資産 (CurrentAssets)
+     - 固定資産 (NonCurrentAssets)
+     - 負債合計 (TotalLiabilities)
+     - 純資産 (TotalEquity)
+
+   【キャッシュフロー計算書】
+     - 営業CF (CashFlowsFromOperatingActivities)
+     - 投資CF (CashFlowsFromInvestingActivities)
+     - 財務CF (CashFlowsFromFinancingActivities)
+
+   【その他の重要指標】
+     - 従業員数 (NumberOfEmployees)
+     - 平均年間給与 (AverageAnnualSalary)
+     - 研究開発費 (ResearchAndDevelopmentExpenses)
+     - 設備投資額 (CapitalExpenditures)
+
+{bar}
+📌 次のステップの提案
+{bar}
+1. XBRLファイルのダウンロード機能を実装
+2. XBRLパーサーを実装して財務データを抽出
+3. メタデータと財務データを統合してデータベースに保存\
+"""
+
+
+def _iter_records(path):
+    """JSON配列のレコードを順に返す（ijsonがあればストリーミング読み込み）"""
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, "item")
+    elif orjson is not None:
+        with open(path, 'rb') as f:
+            yield from orjson.loads(f.read())
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f)
+
+
+def _collect_field_stats(records):
+    """
+    全レコードを1回走査してフィールドごとの型・NULL有無・最大文字列長を集計
     
-    # 最初のレコードからフィールドを取得
-    sample_record = data[0]
+    Returns:
+        (フィールド名→集計結果の辞書, レコード数)
+    """
+    stats = {}
+    count = 0
     
-    # フィールド情報を整理（詳細説明付き）
-    field_info = []
+    for record in records:
+        count += 1
+        for field_name, value in record.items():
+            field_stats = stats.get(field_name)
+            if field_stats is None:
+                field_stats = stats[field_name] = {"types": set(), "max_len": 0, "nonnull": 0, "sample": None}
+            
+            if value is None:
+                continue
+            
+            field_stats["types"].add(type(value).__name__)
+            field_stats["nonnull"] += 1
+            if isinstance(value, str):
+                field_stats["max_len"] = max(field_stats["max_len"], len(value))
+            if field_stats["sample"] is None:
+                field_stats["sample"] = str(value)[:50]
     
-    # フィールド定義（日本語名と詳細説明）
-    field_definitions = {
-        "seqNumber": {
-            "name": "シーケンス番号",
-            "description": "APIレスポンス内での順序番号。1日の中での取得順を示す",
-            "data_category": "メタデータ"
-        },
-        "docID": {
-            "name": "書類ID",
-            "description": "書類を一意に識別するID。XBRLやPDFダウンロード時にこのIDを使用する",
-            "data_category": "メタデータ"
-        },
-        "edinetCode": {
-            "name": "EDINETコード",
-            "description": "金融庁が企業に付与する一意のコード。企業を特定する際の主キー",
-            "data_category": "企業識別"
-        },
-        "secCode": {
-            "name": "証券コード",
-            "description": "上場企業の4桁または5桁の証券コード。東証等で使用される",
-            "data_category": "企業識別"
-        },
-        "JCN": {
-            "name": "法人番号",
-            "description": "国税庁が付与する13桁の法人番号。日本の全法人に付与",
-            "data_category": "企業識別"
-        },
-        "filerName": {
-            "name": "提出者名",
-            "description": "書類を提出した企業の正式名称",
-            "data_category": "企業識別"
-        },
-        "fundCode": {
-            "name": "ファンドコード",
-            "description": "投資信託等のファンドを識別するコード。企業の場合はnull",
-            "data_category": "企業識別"
-        },
-        "ordinanceCode": {
-            "name": "府令コード",
-            "description": "010=企業内容等開示、020=特定有価証券開示など、法的根拠を示す",
-            "data_category": "書類分類"
-        },
-        "formCode": {
-            "name": "様式コード",
-            "description": "030000=有価証券報告書、043000=四半期報告書など、書類の様式",
-            "data_category": "書類分類"
-        },
-        "docTypeCode": {
-            "name": "書類種別コード",
-            "description": "120=有価証券報告書、140=四半期報告書など、書類の種類",
-            "data_category": "書類分類"
-        },
-        "periodStart": {
-            "name": "期間開始日",
-            "description": "会計期間の開始日（YYYY-MM-DD形式）。決算期間の始まり",
-            "data_category": "期間情報"
-        },
-        "periodEnd": {
-            "name": "期間終了日",
-            "description": "会計期間の終了日（YYYY-MM-DD形式）。決算日を示す",
-            "data_category": "期間情報"
-        },
-        "submitDateTime": {
-            "name": "提出日時",
-            "description": "EDINETに書類が提出された日時。法定開示のタイミング",
-            "data_category": "期間情報"
-        },
-        "docDescription": {
-            "name": "書類の説明",
-            "description": "書類の内容を説明する文字列。期や期間を含む詳細情報",
-            "data_category": "書類情報"
-        },
-        "issuerEdinetCode": {
-            "name": "発行者EDINETコード",
-            "description": "有価証券の発行者のEDINETコード。大量保有報告書等で使用",
-            "data_category": "関連企業"
-        },
-        "subjectEdinetCode": {
-            "name": "対象EDINETコード",
-            "description": "公開買付等の対象企業のEDINETコード",
-            "data_category": "関連企業"
-        },
-        "subsidiaryEdinetCode": {
-            "name": "子会社EDINETコード",
-            "description": "子会社のEDINETコード。連結対象を識別",
-            "data_category": "関連企業"
-        },
-        "currentReportReason": {
-            "name": "臨時報告書提出事由",
-            "description": "臨時報告書の場合の提出理由コード",
-            "data_category": "書類情報"
-        },
-        "parentDocID": {
-            "name": "親書類ID",
-            "description": "訂正報告書の場合の元書類ID。書類の関連性を示す",
-            "data_category": "書類情報"
-        },
-        "opeDateTime": {
-            "name": "操作日時",
-            "description": "EDINETでの最終操作日時",
-            "data_category": "期間情報"
-        },
-        "withdrawalStatus": {
-            "name": "取下区分",
-            "description": "0=通常、1=取下済み。取下げられた書類を識別",
-            "data_category": "ステータス"
-        },
-        "docInfoEditStatus": {
-            "name": "書類情報修正区分",
-            "description": "0=通常、1=修正済み、2=削除。書類の修正状態",
-            "data_category": "ステータス"
-        },
-        "disclosureStatus": {
-            "name": "開示不開示区分",
-            "description": "0=開示、1=不開示。一般公開の可否",
-            "data_category": "ステータス"
-        },
-        "xbrlFlag": {
-            "name": "XBRLファイル有無",
-            "description": "1=あり、0=なし。財務データの構造化ファイルの有無。財務分析には必須",
-            "data_category": "ファイル情報"
-        },
-        "pdfFlag": {
-            "name": "PDFファイル有無",
-            "description": "1=あり、0=なし。人間が読むための書類PDFの有無",
-            "data_category": "ファイル情報"
-        },
-        "attachDocFlag": {
-            "name": "代替書面・添付文書有無",
-            "description": "1=あり、0=なし。監査報告書等の添付書類の有無",
-            "data_category": "ファイル情報"
-        },
-        "englishDocFlag": {
-            "name": "英文ファイル有無",
-            "description": "1=あり、0=なし。英語版書類の有無",
-            "data_category": "ファイル情報"
-        },
-        "csvFlag": {
-            "name": "CSVファイル有無",
-            "description": "1=あり、0=なし。財務データのCSV形式ファイルの有無",
-            "data_category": "ファイル情報"
-        },
-        "legalStatus": {
-            "name": "縦覧区分",
-            "description": "1=縦覧中、0=縦覧終了。法定の縦覧期間内かどうか",
-            "data_category": "ステータス"
-        }
-    }
+    return stats, count
+
+
+def _iter_field_rows(stats, record_count):
+    """
+    集計結果からCSVの行（HEADER順のタプル）を1行ずつ生成
     
-    # 各フィールドの情報を収集
-    for field_name, value in sample_record.items():
-        field_type = type(value).__name__
-        if value is None:
+    Args:
+        stats: フィールド名→集計結果の辞書
+        record_count: レコード数
+    """
+    for field_name, field_stats in stats.items():
+        if field_stats["nonnull"] == 0:
             field_type = "null"
             sample_value = "null"
         else:
-            sample_value = str(value)[:50]
+            field_type = "|".join(sorted(field_stats["types"]))
+            sample_value = field_stats["sample"]
         
-        field_def = field_definitions.get(field_name, {
-            "name": "不明",
-            "description": "定義なし",
-            "data_category": "その他"
-        })
+        name_jp, description, data_category = FIELD_DEFINITIONS.get(field_name, _DEFAULT_FIELD_DEFINITION)
         
         # データベース用の推奨型を決定
-        if field_type == "str":
-            if "date" in field_name.lower() or "period" in field_name.lower():
-                if len(sample_value) == 10:
-                    db_type = "DATE"
-                else:
-                    db_type = "DATETIME"
-            elif "code" in field_name.lower() or "Code" in field_name:
-                db_type = "VARCHAR(20)"
-            elif "flag" in field_name.lower() or "Flag" in field_name:
-                db_type = "CHAR(1)"
-            elif "status" in field_name.lower() or "Status" in field_name:
-                db_type = "CHAR(1)"
-            else:
-                db_type = "VARCHAR(255)"
-        elif field_type == "int":
-            db_type = "INTEGER"
-        elif field_type == "null":
-            db_type = "VARCHAR(255)"
-        else:
-            db_type = "TEXT"
+        db_type = _recommend_db_type(field_name, field_type, field_stats["max_len"])
         
         # 主キーやインデックスの推奨
         is_key = ""
         if field_name == "docID":
             is_key = "PRIMARY KEY"
-        elif field_name in ["edinetCode", "secCode", "submitDateTime", "periodEnd"]:
+        elif field_name in _INDEX_FIELDS:
             is_key = "INDEX推奨"
         
         # 財務データかどうか
         has_financial_data = "いいえ（メタデータのみ）"
         
-        field_info.append({
-            "フィールド名": field_name,
-            "日本語名": field_def["name"],
-            "データカテゴリ": field_def["data_category"],
-            "説明": field_def["description"],
-            "データ型": field_type,
-            "推奨DB型": db_type,
-            "キー/インデックス": is_key,
-            "財務データ": has_financial_data,
-            "サンプル値": sample_value,
-            "必須": "Yes" if value is not None else "No"
-        })
-    
-    # CSV出力
-    output_file = f"edinet_metadata_{datetime.now().strftime('%Y%m%d')}.csv"
-    
-    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=field_info[0].keys())
-        writer.writeheader()
-        writer.writerows(field_info)
+        yield (
+            field_name,
+            name_jp,
+            data_category,
+            description,
+            field_type,
+            db_type,
+            is_key,
+            has_financial_data,
+            sample_value,
+            "Yes" if field_stats["nonnull"] == record_count else "No"
+        )
+
+
+def analyze_edinet_fields_with_details():
+    """取得済みデータから利用可能な項目を分析（詳細説明付き）"""
     
-    print("=" * 70)
-    print("📊 現在取得しているデータの分析結果")
-    print("=" * 70)
-    print(f"✅ フィールド分析完了: {len(field_info)}個のフィールド")
-    print(f"💾 保存先: {output_file}")
+    # 全レコードを1回走査して集計（先頭レコードのみではNULLの項目を誤判定するため）
+    stats, record_count = _collect_field_stats(_iter_records('financial_data.json'))
     
-    # カテゴリ別集計
-    categories = {}
-    for field in field_info:
-        cat = field["データカテゴリ"]
-        categories[cat] = categories.get(cat, 0) + 1
+    if record_count == 0:
+        print("データがありません")
+        return
     
-    print("\n📂 データカテゴリ別の項目数:")
-    for cat, count in sorted(categories.items()):
-        print(f"  - {cat}: {count}項目")
+    # CSV出力（行は生成しながら書き出し、カテゴリ別件数も同時に集計）
+    output_file = f"edinet_metadata_{datetime.now().strftime('%Y%m%d')}.csv"
+    categories = Counter()
     
-    print("\n" + "=" * 70)
-    print("⚠️  重要な注意事項")
-    print("=" * 70)
-    print("現在取得しているのは「書類のメタデータ」のみです。")
-    print("実際の財務数値（売上高、利益等）は含まれていません。")
+    with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        for row in _iter_field_rows(stats, record_count):
+            writer.writerow(row)
+            categories[row[2]] += 1
     
-    print("\n" + "=" * 70)
-    print("💰 実際の財務データを取得するには")
-    print("=" * 70)
-    print("XBRLファイルをダウンロードして解析する必要があります：")
-    print()
-    print("1️⃣  docIDを使用してXBRLファイルをダウンロード")
-    print("   例: https://api.edinet-fsa.go.jp/api/v2/documents/{docID}?type=1")
-    print()
-    print("2️⃣  XBRLファイル内から財務データを抽出")
-    print("   取得可能な主な財務データ：")
-    print("   【損益計算書】")
-    print("     - 売上高 (NetSales)")
-    print("     - 売上原価 (CostOfSales)")
-    print("     - 営業利益 (OperatingIncome)")
-    print("     - 経常利益 (OrdinaryIncome)")
-    print("     - 当期純利益 (NetIncome)")
-    print()
-    print("   【貸借対照表】")
-    print("     - 総資産 (TotalAssets)")
-    print("     - 流動資産 (CurrentAssets)")
-    print("     - 固定資産 (NonCurrentAssets)")
-    print("     - 負債合計 (TotalLiabilities)")
-    print("     - 純資産 (TotalEquity)")
-    print()
-    print("   【キャッシュフロー計算書】")
-    print("     - 営業CF (CashFlowsFromOperatingActivities)")
-    print("     - 投資CF (CashFlowsFromInvestingActivities)")
-    print("     - 財務CF (CashFlowsFromFinancingActivities)")
-    print()
-    print("   【その他の重要指標】")
-    print("     - 従業員数 (NumberOfEmployees)")
-    print("     - 平均年間給与 (AverageAnnualSalary)")
-    print("     - 研究開発費 (ResearchAndDevelopmentExpenses)")
-    print("     - 設備投資額 (CapitalExpenditures)")
+    field_count = sum(categories.values())
+    cats = "\n".join(f"  - {cat}: {count}項目" for cat, count in sorted(categories.items()))
     
-    print("\n" + "=" * 70)
-    print("📌 次のステップの提案")
-    print("=" * 70)
-    print("1. XBRLファイルのダウンロード機能を実装")
-    print("2. XBRLパーサーを実装して財務データを抽出")
-    print("3. メタデータと財務データを統合してデータベースに保存")
+    # レポートはまとめて1回で出力
+    print(_REPORT_TEMPLATE.format(bar=_BAR, n=field_count, out=output_file, cats=cats))
     
-    return field_info
+    return field_count
 
 if __name__ == "__main__":
     print("=== EDINET取得可能項目の詳細分析 ===\n")
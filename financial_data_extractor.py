@@ -3,6 +3,7 @@
 企業選択から70項目の財務データ抽出まで一元化
 """
 import pandas as pd
+import csv
 import json
 import logging
 import os
@@ -10,96 +11,480 @@ import zipfile
 import tempfile
 import shutil
 import re
+import hashlib
+import functools
+import heapq
+import multiprocessing
+import threading
+from collections import Counter
 from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait
 from bs4 import BeautifulSoup
+from lxml import etree
 import xml.etree.ElementTree as ET
 
-from edinet_client.api.client import EdinetAPIClient
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+from edinet_client.api.client import get_default_client
+from edinet_client.config import DEFAULT_CACHE_DIR
 
 # ログ設定
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 文書一覧を並列取得する際の同時実行数（送信間隔はクライアントのレート制限に従う）
+SEARCH_MAX_WORKERS = 8
+
+# 全銘柄一括処理の並列数（ダウンロードはスレッド、XBRL解析はプロセス）
+DOWNLOAD_MAX_WORKERS = 16
+PARSE_MAX_WORKERS = os.cpu_count() or 1
+
+# 解析プロセスの起動方式（スレッド実行中のforkはロックを握ったまま複製されるため使わない）
+_PARSE_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# 個別ファイル（CSV/JSON）をバックグラウンドで書き込むスレッド数
+WRITE_MAX_WORKERS = 2
+
+# 保存済みXBRL ZIP（cache/xbrl）の合計サイズ上限（超えたら最終利用の古いものから上限の8割まで削除）
+XBRL_CACHE_MAX_BYTES = 2 * 1024 ** 3
+
+# 数値以外の文字（数字・小数点・マイナス記号以外）
+_NON_NUMERIC_RE = re.compile(r'[^\d.-]')
+
+
+# XBRLエレメント名の主な名前空間プレフィックス
+_COMMON_PREFIXES = (
+    'jppfs_cor', 'jpcrp_cor', 'jpdei_cor', 'jpigp_cor',
+    'us-gaap', 'ifrs', 'jpfr', 'jpcre', 'jpcrp'
+)
+
+# 期間情報のキーと、エレメント名（小文字）に含まれるかを判定するパターン（優先順）
+_PERIOD_PATTERNS = (
+    ('period_start', ('periodstart', 'startdate')),
+    ('period_end', ('periodend', 'enddate')),
+    ('instant', ('instant',))
+)
+_PERIOD_SUBSTRINGS = tuple(pattern for _, patterns in _PERIOD_PATTERNS for pattern in patterns)
+
+
+@functools.lru_cache(maxsize=None)
+def _period_patterns_in(name_lower: str) -> Tuple[str, ...]:
+    """小文字化したエレメント名に含まれる期間パターンを取得（タクソノミの語彙は文書間で共通のためキャッシュ）"""
+    return tuple(pattern for pattern in _PERIOD_SUBSTRINGS if pattern in name_lower)
+
+# 財務データCSVの列順
+_CSV_COLUMNS = ('date', 'doc_name', 'item_key', 'japanese_name', 'value', 'unit', 'importance', 'category')
+
+# 全銘柄一括処理の集約ファイルの列順
+_BATCH_COLUMNS = (
+    'edinet_code', 'sec_code', 'doc_id', 'doc_date', 'doc_name',
+    'item_key', 'japanese_name', 'value', 'unit', 'importance', 'category'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_element_patterns(base_element: str) -> Tuple[str, ...]:
+    """XBRLエレメント名のパターンを生成（同じローカル名の文字列は共有する）"""
+    element_name = sys.intern(base_element.split(':')[-1])
+    
+    return (
+        sys.intern(base_element),
+        *(sys.intern(f"{prefix}:{element_name}") for prefix in _COMMON_PREFIXES),
+        element_name
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_xbrl_filename(filename_lower: str) -> str:
+    """XBRLファイルの種類を分類（小文字化したファイル名で判定）"""
+    if 'jpcrp' in filename_lower and 'instance' in filename_lower:
+        return "有価証券報告書インスタンス文書"
+    elif 'jpcrp' in filename_lower:
+        return "有価証券報告書関連"
+    elif 'jpdei' in filename_lower:
+        return "基本情報タクソノミ"
+    elif 'jpigp' in filename_lower:
+        return "業種別タクソノミ"
+    elif 'jppfs' in filename_lower:
+        return "財務諸表タクソノミ"
+    elif 'instance' in filename_lower:
+        return "インスタンス文書"
+    elif 'taxonomy' in filename_lower or 'tax' in filename_lower:
+        return "タクソノミファイル"
+    else:
+        return "その他XBRL文書"
+
+
+# 様式コードから推定する書類種別
+_FORM_CODE_TO_DOC_NAME = {
+    '010000': '届出書',
+    '020000': '目論見書',
+    '030000': '有価証券報告書',
+    '040000': '四半期報告書',
+    '050000': '半期報告書',
+    '060000': '臨時報告書',
+    '070000': '臨時報告書',
+    '080000': '親会社等状況報告書',
+    '090000': '自己株券買付状況報告書',
+    '100000': '変更報告書',
+    '110000': '訂正届出書',
+    '120000': '有価証券報告書',
+    '130000': '有価証券報告書（訂正）'
+}
+
+
+# 四半期報告書の様式コード
+_QUARTERLY_FORM_CODES = frozenset({'043000', '044000'})
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_document(doc_description: str, form_code: str) -> str:
+    """文書種別を分類（書類概要と様式コードで判定）"""
+    # 有価証券報告書
+    if '有価証券報告書' in doc_description or form_code == '030000':
+        return '有価証券報告書'
+    # 四半期報告書
+    elif '四半期報告書' in doc_description or form_code in _QUARTERLY_FORM_CODES:
+        return '四半期報告書'
+    # 半期報告書  
+    elif '半期報告書' in doc_description or form_code == '050000':
+        return '半期報告書'
+    # 臨時報告書
+    elif '臨時報告書' in doc_description or form_code == '070000':
+        return '臨時報告書'
+    # 有価証券届出書
+    elif '有価証券届出書' in doc_description:
+        return '有価証券届出書'
+    # 変更報告書
+    elif '変更報告書' in doc_description:
+        return '変更報告書'
+    # 訂正報告書
+    elif '訂正' in doc_description:
+        if '有価証券報告書' in doc_description:
+            return '有価証券報告書（訂正）'
+        elif '四半期報告書' in doc_description:
+            return '四半期報告書（訂正）'
+        elif '半期報告書' in doc_description:
+            return '半期報告書（訂正）'
+        else:
+            return '訂正報告書'
+    else:
+        # form_codeから推定
+        return _FORM_CODE_TO_DOC_NAME.get(form_code, 'その他書類')
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(date_text: str) -> date:
+    """YYYY-MM-DD形式の文字列を日付に変換（同じ入力の再解析を省く）"""
+    return datetime.strptime(date_text, '%Y-%m-%d').date()
+
+
+def _find_latest_file(prefix: str, suffix: str, directory: str = '.') -> Optional[Path]:
+    """フォルダ内で「prefix*suffix」に一致するファイルのうち、名前順で最後のものを取得"""
+    with os.scandir(directory) as it:
+        names = [
+            entry.name for entry in it
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and entry.is_file()
+        ]
+    return Path(directory) / max(names) if names else None
+
+
+def _iter_xbrl_entries(root: str):
+    """フォルダ以下の.xbrlファイルを再帰的に列挙（os.scandirのDirEntryを返す）"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith('.xbrl'):
+                    yield entry
+
+
+def _write_json(path, data: Dict):
+    """JSONファイルを書き出し（orjsonがあれば使用）"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+                default=str
+            ))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+
+
+def _read_json(path) -> Dict:
+    """JSONファイルを読み込み（orjsonがあれば使用）"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class _BatchWriter:
+    """
+    一括処理の財務データを集約ファイルへ逐次追記
+    
+    Parquet（pyarrow未導入時はCSV）を初回書き込み時に作成し、呼び出しごとに追記する
+    （Parquetは1回の書き込みが1行グループ）。全行をメモリに溜めないため、
+    長時間の処理を中断しても追記済みの分は残る。
+    """
+    
+    def __init__(self, output_dir: Path):
+        """
+        初期化
+        
+        Args:
+            output_dir: 集約ファイルの保存先フォルダ
+        """
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        suffix = 'parquet' if pq is not None else 'csv'
+        self.output_dir = output_dir
+        self.path = output_dir / f"batch_{timestamp}.{suffix}"
+        self.row_count = 0
+        self._parquet_writer = None
+        self._csv_file = None
+        self._csv_writer = None
+    
+    def __enter__(self) -> "_BatchWriter":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def write(self, rows: List[Dict]):
+        """行を追記（_iter_batch_rowsで生成した行のリスト）"""
+        if not rows:
+            return
+        
+        if pq is not None:
+            if self._parquet_writer is None:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                # 値が全て欠損の日があっても型が揺れないよう、全列を文字列として固定
+                schema = pa.schema([(column, pa.string()) for column in _BATCH_COLUMNS])
+                self._parquet_writer = pq.ParquetWriter(self.path, schema, compression='zstd')
+            self._parquet_writer.write_table(pa.Table.from_pylist(rows, schema=self._parquet_writer.schema))
+        else:
+            if self._csv_writer is None:
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                self._csv_file = open(self.path, 'w', newline='', encoding='utf-8-sig')
+                self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=_BATCH_COLUMNS, lineterminator=os.linesep)
+                self._csv_writer.writeheader()
+            self._csv_writer.writerows(rows)
+            self._csv_file.flush()
+        
+        self.row_count += len(rows)
+    
+    def close(self) -> Optional[Path]:
+        """
+        集約ファイルを閉じる
+        
+        Returns:
+            保存したファイルのパス（1行も書き込んでいない場合はNone）
+        """
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+        
+        if not self.row_count:
+            return None
+        
+        logger.info(f"集約ファイル保存完了: {self.path} ({self.row_count}行)")
+        return self.path
+
 
 class FinancialDataExtractor:
     """統合財務データ取得システム"""
     
-    def __init__(self):
-        self.client = EdinetAPIClient()
+    def __init__(self, verbose: bool = True, use_xbrl_cache: bool = True,
+                 parse_state: Optional[Tuple[Dict, Dict, Dict]] = None):
+        """
+        初期化
+        
+        Args:
+            verbose: Falseの場合、一括処理で文書ごとの進捗表示を行わない
+            use_xbrl_cache: Falseの場合、保存済みのXBRL ZIPを使わず常に再ダウンロードする
+            parse_state: 指定時はXBRL解析専用の軽量モード（_get_parse_stateの結果を使い、
+                         APIクライアント・企業リスト・処理済み記録は読み込まない）
+        """
+        parse_only = parse_state is not None
+        self.verbose = verbose
+        self.use_xbrl_cache = use_xbrl_cache
+        # プロセス内で共有するクライアント（1つのSessionの接続プールを全リクエストで再利用）
+        self.client = None if parse_only else get_default_client()
         self.edinet_list_df = None
+        self._edinet_name_lower = None
+        self._edinet_index = {}
         self.fund_list_df = None
         self.financial_mapping = {}
-        self.load_company_lists()
-        self.load_financial_mapping()
+        self._localname_to_items = {}
+        self._item_skeletons = {}
+        self._csv_item_rows = []
+        self._done_path = Path(DEFAULT_CACHE_DIR) / 'done.txt'
+        self._done_documents = {} if parse_only else self._load_done_documents()
+        self._done_outputs = set(self._done_documents.values())
+        self._output_json_names = None
+        # 書き込みスレッドと共有する処理済み記録・出力ファイル名集合の保護用
+        self._done_lock = threading.Lock()
+        # 保存済みXBRL ZIPの合計サイズ（初回の追加時に走査）とその保護用
+        self._xbrl_cache_bytes: Optional[int] = None
+        self._xbrl_cache_lock = threading.Lock()
+        self._day_cache: Dict[date, List[Dict]] = {}
+        self._day_index_cache: Dict[date, Dict[str, List[Dict]]] = {}
+        
+        if parse_only:
+            self._set_parse_state(parse_state)
+        else:
+            self.load_company_lists()
+            self.load_financial_mapping()
     
     def load_company_lists(self):
         """企業・ファンドリストを読み込み"""
         try:
             # EDINETコードリスト読み込み
-            edinet_files = list(Path('.').glob('list_edinetcode_*.csv'))
-            if edinet_files:
-                latest_edinet = max(edinet_files, key=lambda x: x.name)
-                self.edinet_list_df = pd.read_csv(latest_edinet, encoding='utf-8-sig')
+            latest_edinet = _find_latest_file('list_edinetcode_', '.csv')
+            if latest_edinet:
+                self.edinet_list_df = self._read_csv_cached(latest_edinet)
+                # 検索用: EDINETコードはカテゴリ型、企業名は小文字化済みの列を保持
+                # （company_infoとして保存される行を汚さないようDataFrameとは別に持つ）
+                self.edinet_list_df['EDINETコード'] = self.edinet_list_df['EDINETコード'].astype('category')
+                self._edinet_name_lower = self.edinet_list_df['提出者名'].str.lower()
+                
+                # EDINETコード → 企業情報の索引（重複時は先頭の行を採用）
+                self._edinet_index = {}
+                for record in self.edinet_list_df.to_dict('records'):
+                    self._edinet_index.setdefault(record['EDINETコード'], record)
                 logger.info(f"EDINETリスト読み込み: {latest_edinet.name} ({len(self.edinet_list_df)}件)")
             
             # ファンドコードリスト読み込み
-            fund_files = list(Path('.').glob('list_fundcode_*.csv'))
-            if fund_files:
-                latest_fund = max(fund_files, key=lambda x: x.name)
-                self.fund_list_df = pd.read_csv(latest_fund, encoding='utf-8-sig')
+            latest_fund = _find_latest_file('list_fundcode_', '.csv')
+            if latest_fund:
+                self.fund_list_df = self._read_csv_cached(latest_fund)
                 logger.info(f"ファンドリスト読み込み: {latest_fund.name} ({len(self.fund_list_df)}件)")
                 
         except Exception as e:
             logger.error(f"企業リスト読み込みエラー: {e}")
             raise
     
+    def _read_csv_cached(self, csv_path: Path) -> pd.DataFrame:
+        """CSVを読み込み（元ファイルが更新されていなければpickleキャッシュを使用）"""
+        stat = csv_path.stat()
+        cache_key = hashlib.md5(f"{csv_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+        cache_dir = Path(DEFAULT_CACHE_DIR) / 'lists'
+        cache_path = cache_dir / f"{csv_path.stem}_{cache_key}.pkl"
+        
+        if cache_path.exists():
+            try:
+                return pd.read_pickle(cache_path)
+            except Exception as e:
+                logger.warning(f"キャッシュ読み込みエラー: {cache_path} ({e})")
+        
+        df = pd.read_csv(csv_path, encoding='utf-8-sig')
+        
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            # 元ファイル更新前の古いキャッシュを削除
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.name.startswith(f"{csv_path.stem}_") and entry.name.endswith('.pkl'):
+                        os.unlink(entry.path)
+            df.to_pickle(cache_path)
+        except OSError as e:
+            logger.warning(f"キャッシュ書き込みエラー: {cache_path} ({e})")
+        
+        return df
+    
     def load_financial_mapping(self):
         """70項目の財務指標マッピングを読み込み"""
         try:
-            mapping_files = list(Path('.').glob('xbrl_fin_metadata_*.csv'))
-            if not mapping_files:
+            latest_mapping = _find_latest_file('xbrl_fin_metadata_', '.csv')
+            if not latest_mapping:
                 logger.error("財務指標マッピングファイルが見つかりません")
                 return
             
-            latest_mapping = max(mapping_files, key=lambda x: x.name)
-            df = pd.read_csv(latest_mapping, encoding='utf-8-sig')
+            df = self._read_csv_cached(latest_mapping)
             
-            # XBRLエレメント名と項目のマッピングを作成
-            for _, row in df.iterrows():
-                if pd.notna(row['xbrl_element']) and row['xbrl_element'] != '計算項目':
-                    element_patterns = self._generate_element_patterns(row['xbrl_element'])
-                    self.financial_mapping[row['item_name_en']] = {
-                        'japanese_name': row['item_name_jp'],
+            # XBRLエレメント名と項目のマッピングを作成（iterrowsは行ごとにSeriesを作るため列をzipで走査）
+            rows = zip(
+                df['xbrl_element'], df['item_name_en'], df['item_name_jp'],
+                df['unit'], df['importance'], df['category']
+            )
+            for xbrl_element, item_name_en, item_name_jp, unit, importance, category in rows:
+                if pd.notna(xbrl_element) and xbrl_element != '計算項目':
+                    element_patterns = self._generate_element_patterns(xbrl_element)
+                    self.financial_mapping[item_name_en] = {
+                        'japanese_name': item_name_jp,
                         'xbrl_patterns': element_patterns,
-                        'unit': row['unit'],
-                        'importance': row['importance'],
-                        'category': row['category']
+                        'unit': unit,
+                        'importance': importance,
+                        'category': category
                     }
             
+            # エレメントのローカル名（小文字）→ 項目キーの逆引きを作成
+            for item_key, mapping_info in self.financial_mapping.items():
+                for pattern in mapping_info['xbrl_patterns']:
+                    local_name = pattern.split(':')[-1].lower()
+                    item_keys = self._localname_to_items.setdefault(local_name, [])
+                    if item_key not in item_keys:
+                        item_keys.append(item_key)
+            
+            # 抽出結果の項目ごとのひな形（抽出時はコピーして値のみ設定）
+            self._item_skeletons = {
+                item_key: {
+                    'value': None,
+                    'japanese_name': v['japanese_name'],
+                    'unit': v['unit'],
+                    'importance': v['importance'],
+                    'category': v['category']
+                }
+                for item_key, v in self.financial_mapping.items()
+            }
+            
+            # CSV出力用の項目メタデータ（欠損値は空欄として1回だけ作成）
+            self._csv_item_rows = [
+                (item_key, *('' if pd.isna(v[field]) else v[field]
+                             for field in ('japanese_name', 'unit', 'importance', 'category')))
+                for item_key, v in self.financial_mapping.items()
+            ]
+            
             logger.info(f"財務指標マッピング読み込み: {len(self.financial_mapping)}項目")
             
         except Exception as e:
             logger.error(f"財務指標マッピング読み込みエラー: {e}")
     
-    def _generate_element_patterns(self, base_element: str) -> List[str]:
+    def _get_parse_state(self) -> Tuple[Dict, Dict, Dict]:
+        """XBRL解析に必要な状態を取得（解析ワーカーへ渡す）"""
+        return self.financial_mapping, self._localname_to_items, self._item_skeletons
+    
+    def _set_parse_state(self, parse_state: Tuple[Dict, Dict, Dict]):
+        """_get_parse_stateで取得した状態を設定"""
+        self.financial_mapping, self._localname_to_items, self._item_skeletons = parse_state
+    
+    def _generate_element_patterns(self, base_element: str) -> Tuple[str, ...]:
         """XBRLエレメント名のパターンを生成"""
-        patterns = [base_element]
-        
-        element_name = base_element.split(':')[-1]
-        
-        common_prefixes = [
-            'jppfs_cor', 'jpcrp_cor', 'jpdei_cor', 'jpigp_cor',
-            'us-gaap', 'ifrs', 'jpfr', 'jpcre', 'jpcrp'
-        ]
-        
-        for prefix in common_prefixes:
-            patterns.append(f"{prefix}:{element_name}")
-        
-        patterns.append(element_name)
-        return patterns
+        return _generate_element_patterns(base_element)
     
     def display_company_selection_menu(self, 
                                       filter_by_sec_code: bool = True,
@@ -109,7 +494,8 @@ class FinancialDataExtractor:
             logger.error("EDINETリストが読み込まれていません")
             return None
         
-        df = self.edinet_list_df.copy()
+        # 読み取りのみのためコピーせず、フィルタで新しいフレームを得る
+        df = self.edinet_list_df
         
         if filter_by_sec_code:
             df = df[df['証券コード'].notna() & (df['証券コード'] != '')]
@@ -125,12 +511,7 @@ class FinancialDataExtractor:
         print("番号 | EDINETコード | 証券コード | 企業名")
         print("-" * 80)
         
-        for i, (_, row) in enumerate(df_display.iterrows(), 1):
-            edinet_code = row['EDINETコード']
-            sec_code = row['証券コード'] if pd.notna(row['証券コード']) else 'なし'
-            company_name = row['提出者名'][:30]
-            
-            print(f"{i:3d}  | {edinet_code:10s} | {str(sec_code):8s} | {company_name}")
+        self._print_company_rows(df_display)
         
         print(f"\n検索オプション:")
         print(f"{len(df_display) + 1}: 企業名で検索")
@@ -170,13 +551,28 @@ class FinancialDataExtractor:
                 print("\n処理を中断しました。")
                 return None
     
+    def _print_company_rows(self, df: pd.DataFrame):
+        """企業一覧を番号付きで表示（行ごとのSeries生成を避けて列配列をまとめて走査）"""
+        rows = zip(df['EDINETコード'].to_numpy(), df['証券コード'].to_numpy(), df['提出者名'].to_numpy())
+        
+        for i, (edinet_code, sec_code, company_name) in enumerate(rows, 1):
+            if pd.isna(sec_code):
+                sec_code = 'なし'
+            
+            print(f"{i:3d}  | {edinet_code:10s} | {str(sec_code):8s} | {company_name[:30]}")
+    
     def _search_by_name(self, df: pd.DataFrame) -> Optional[Dict]:
         """企業名で検索"""
         search_term = input("企業名の一部を入力してください: ").strip()
         if not search_term:
             return None
         
-        results = df[df['提出者名'].str.contains(search_term, na=False, case=False)]
+        if self._edinet_name_lower is not None:
+            names_lower = self._edinet_name_lower.loc[df.index]
+        else:
+            names_lower = df['提出者名'].str.lower()
+        
+        results = df[names_lower.str.contains(search_term.lower(), na=False, regex=False)]
         return self._select_from_search_results(results, f"'{search_term}'を含む企業")
     
     def _search_by_edinet_code(self, df: pd.DataFrame) -> Optional[Dict]:
@@ -212,12 +608,7 @@ class FinancialDataExtractor:
         print("番号 | EDINETコード | 証券コード | 企業名")
         print("-" * 80)
         
-        for i, (_, row) in enumerate(results.iterrows(), 1):
-            edinet_code = row['EDINETコード']
-            sec_code = row['証券コード'] if pd.notna(row['証券コード']) else 'なし'
-            company_name = row['提出者名'][:30]
-            
-            print(f"{i:3d}  | {edinet_code:10s} | {str(sec_code):8s} | {company_name}")
+        self._print_company_rows(results)
         
         while True:
             try:
@@ -252,24 +643,24 @@ class FinancialDataExtractor:
                 fiscal_month = int(month_str)
                 fiscal_day = int(day_str)
                 
-                potential_dates = []
+                today = date.today()
+                dates_by_year = []
                 
                 for year in [current_year, current_year - 1]:
                     try:
                         fiscal_date = date(year, fiscal_month, fiscal_day)
                         
                         filing_start = fiscal_date + timedelta(days=60)
-                        filing_end = fiscal_date + timedelta(days=90)
+                        filing_end = min(fiscal_date + timedelta(days=90), today)
                         
-                        current_date = filing_start
-                        while current_date <= filing_end and current_date <= date.today():
-                            potential_dates.append(current_date)
-                            current_date += timedelta(days=1)
+                        # 新しい日付から順に生成（並べ替え不要）
+                        days = (filing_end - filing_start).days
+                        dates_by_year.append([filing_end - timedelta(days=i) for i in range(days + 1)])
                             
                     except ValueError:
                         continue
                 
-                return sorted(potential_dates, reverse=True)
+                return list(heapq.merge(*dates_by_year, reverse=True))
                 
         except Exception as e:
             logger.warning(f"決算期解析エラー: {e}")
@@ -297,61 +688,222 @@ class FinancialDataExtractor:
         
         found_documents = []
         
-        for search_date in search_dates:
+        # 文書一覧の取得は並列に行い、結果は新しい日付から順に確認する
+        with ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS) as executor:
+            futures = [(d, executor.submit(self.client.get_documents_list, d)) for d in search_dates]
+            
             try:
-                logger.info(f"検索中: {search_date}")
-                
-                documents = self.client.get_documents_list(search_date)
-                securities_reports = self.client.filter_securities_reports(documents)
-                
-                for doc in securities_reports:
-                    if doc.get("edinetCode") == target_edinet_code:
-                        found_documents.append(doc)
-                        logger.info(f"発見: {doc.get('docDescription')} (提出: {doc.get('submitDateTime')})")
+                for search_date, future in futures:
+                    try:
+                        logger.info(f"検索中: {search_date}")
+                        
+                        documents = future.result()
+                        securities_reports = self.client.filter_securities_reports(documents, require_xbrl=True)
+                        
+                        for doc in securities_reports:
+                            if doc.get("edinetCode") == target_edinet_code:
+                                found_documents.append(doc)
+                                logger.info(f"発見: {doc.get('docDescription')} (提出: {doc.get('submitDateTime')})")
+                                
+                                if len(found_documents) >= 1:
+                                    logger.info("最新の有価証券報告書を発見したため検索を終了")
+                                    return found_documents
                         
-                        if len(found_documents) >= 1:
-                            logger.info("最新の有価証券報告書を発見したため検索を終了")
-                            return found_documents
+                    except Exception as e:
+                        logger.warning(f"{search_date} の検索でエラー: {e}")
+                        continue
+            finally:
+                # 発見後は未実行の取得を取り消す
+                for _, future in futures:
+                    future.cancel()
+        
+        return found_documents
+    
+    def _fetch_day(self, target_date: date) -> List[Dict]:
+        """指定日の文書一覧を取得し、有価証券報告書等に絞り込む（過去日の結果はメモリに保持）"""
+        securities_reports = self._day_cache.get(target_date)
+        if securities_reports is not None:
+            return securities_reports
+        
+        documents = self.client.get_documents_list(target_date)
+        securities_reports = self.client.filter_securities_reports(documents, require_xbrl=True)
+        
+        # 当日以降の一覧は更新されうるため保持しない
+        if target_date < date.today():
+            self._day_cache[target_date] = securities_reports
+        
+        return securities_reports
+    
+    def _index_day_by_edinet_code(self, target_date: date, securities_reports: List[Dict]) -> Dict[str, List[Dict]]:
+        """指定日の有価証券報告書等をEDINETコードで索引化（過去日の索引はメモリに保持）"""
+        index = self._day_index_cache.get(target_date)
+        if index is None:
+            index = {}
+            for doc in securities_reports:
+                index.setdefault(doc.get("edinetCode"), []).append(doc)
+            
+            if target_date < date.today():
+                self._day_index_cache[target_date] = index
+        
+        return index
+    
+    def _iter_day_fetches(self, start_dt: date, end_dt: date):
+        """
+        期間内の各日の文書取得を並列に開始し、日付順に(日付, Future)を返す
+        
+        Future.result()で有価証券報告書等のリストを取得する（取得時の例外もそこで送出される）。
+        呼び出し側が途中で反復を終えた場合、未実行の取得は取り消す。
+        """
+        dates = [date.fromordinal(ordinal) for ordinal in range(start_dt.toordinal(), end_dt.toordinal() + 1)]
+        
+        yield from self.client.get_documents_lists(dates, max_workers=SEARCH_MAX_WORKERS, fetch=self._fetch_day)
+    
+    def _scan_company_documents(self, edinet_code: str, start_dt: date, end_dt: date) -> List[Dict]:
+        """期間内の対象企業の有価証券報告書等を日付順に検索"""
+        all_documents = []
+        
+        # 文書一覧の取得は並列に行い、結果は日付順に確認する
+        for current_date, day_future in self._iter_day_fetches(start_dt, end_dt):
+            print(f"検索中: {current_date}")
+            
+            try:
+                day_index = self._index_day_by_edinet_code(current_date, day_future.result())
+                date_str = str(current_date)
+                
+                # 対象企業の文書のみ抽出
+                for doc in day_index.get(edinet_code, ()):
+                    doc['search_date'] = date_str  # 検索日を記録
+                    doc_name = self._classify_document_type(doc)
+                    all_documents.append(doc)
+                    print(f"  発見: {doc_name} - {doc.get('docDescription')} (提出: {doc.get('submitDateTime')})")
                 
             except Exception as e:
-                logger.warning(f"{search_date} の検索でエラー: {e}")
-                continue
+                print(f"  エラー: {e}")
         
-        return found_documents
+        return all_documents
     
     def download_and_extract_xbrl(self, doc_id: str, output_dir: str = "temp_xbrl") -> str:
         """XBRLファイルをダウンロードして解凍"""
-        logger.info(f"文書 {doc_id} をダウンロード中...")
-        
-        zip_data = self.client.download_document(doc_id)
-        
         output_path = Path(output_dir) / doc_id
         output_path.mkdir(parents=True, exist_ok=True)
         
-        with tempfile.NamedTemporaryFile(suffix='.zip') as temp_zip:
-            temp_zip.write(zip_data)
-            temp_zip.flush()
-            
-            with zipfile.ZipFile(temp_zip.name, 'r') as zip_ref:
-                zip_ref.extractall(output_path)
+        zip_path = self._get_xbrl_zip(doc_id)
+        
+        # 後続処理で使うXBRLインスタンスとマニフェストのみ解凍
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = [
+                name for name in zip_ref.namelist()
+                if name.lower().endswith('.xbrl') or 'manifest' in name.lower()
+            ]
+            zip_ref.extractall(output_path, members=members)
         
         logger.info(f"ファイルを {output_path} に解凍しました")
         return str(output_path)
     
+    def _get_xbrl_zip(self, doc_id: str) -> Path:
+        """文書のZIPを取得（cache/xbrlに保存済みであれば再ダウンロードしない）"""
+        cache_dir = Path(DEFAULT_CACHE_DIR) / 'xbrl'
+        cache_path = cache_dir / f"{doc_id}.zip"
+        
+        if self.use_xbrl_cache and cache_path.exists():
+            if zipfile.is_zipfile(cache_path):
+                logger.info(f"保存済みのZIPを使用: {cache_path}")
+                # 最終利用日時を更新（容量超過時は利用の古いものから削除する）
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                return cache_path
+            logger.warning(f"保存済みのZIPが壊れているため再ダウンロードします: {cache_path}")
+        
+        logger.info(f"文書 {doc_id} をダウンロード中...")
+        
+        # 一時ファイルへダウンロードし、ZIPとして読めることを確認してから置き換え
+        # （中断時の不完全なファイルやエラー応答をキャッシュに残さない）
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{doc_id}.", suffix='.tmp')
+        os.close(fd)
+        try:
+            self.client.download_document(doc_id, temp_path)
+            if not zipfile.is_zipfile(temp_path):
+                raise zipfile.BadZipFile(f"ダウンロードした文書 {doc_id} がZIP形式ではありません")
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+        
+        # キャッシュの容量管理に失敗しても、ダウンロード済みの文書の処理は続ける
+        try:
+            self._add_xbrl_cache_size(cache_dir, size, keep_path=cache_path)
+        except OSError as e:
+            logger.warning(f"XBRLキャッシュの容量管理エラー: {e}")
+        return cache_path
+    
+    def _scan_xbrl_cache(self, cache_dir: Path) -> List[Tuple[float, int, str]]:
+        """保存済みZIPの(最終利用日時, サイズ, パス)を取得（走査中に置き換え・削除されたものは除く）"""
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.zip'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.debug(f"XBRLキャッシュの参照をスキップ: {entry.path} ({e})")
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _add_xbrl_cache_size(self, cache_dir: Path, added_bytes: int, keep_path: Optional[Path] = None):
+        """保存済みZIPの合計サイズを更新し、上限を超えた場合は最終利用の古いものから削除（keep_pathは削除しない）"""
+        with self._xbrl_cache_lock:
+            if self._xbrl_cache_bytes is None:
+                self._xbrl_cache_bytes = sum(size for _, size, _ in self._scan_xbrl_cache(cache_dir))
+            else:
+                self._xbrl_cache_bytes += added_bytes
+            
+            if self._xbrl_cache_bytes <= XBRL_CACHE_MAX_BYTES:
+                return
+            
+            entries = sorted(self._scan_xbrl_cache(cache_dir))
+            keep_name = keep_path.name if keep_path is not None else None
+            
+            total = sum(size for _, size, _ in entries)
+            target = XBRL_CACHE_MAX_BYTES * 0.8
+            removed = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                if os.path.basename(path) == keep_name:
+                    continue
+                # 他のスレッドが使用中（Windowsでは削除不可）・削除済みのものは残したまま次へ
+                try:
+                    os.unlink(path)
+                except OSError as e:
+                    logger.debug(f"XBRLキャッシュの削除をスキップ: {path} ({e})")
+                    continue
+                total -= size
+                removed += 1
+            
+            self._xbrl_cache_bytes = total
+            logger.info(f"XBRLキャッシュの容量上限を超えたため {removed}件を削除しました")
+    
     def find_xbrl_files(self, extract_path: str) -> List[Dict[str, str]]:
         """XBRLファイルを検索して詳細情報を取得"""
         xbrl_files = []
         
-        for xbrl_file in Path(extract_path).glob("**/*.xbrl"):
+        for entry in _iter_xbrl_entries(extract_path):
             file_info = {
-                'path': str(xbrl_file),
-                'name': xbrl_file.name,
-                'size': xbrl_file.stat().st_size,
-                'type': self._classify_xbrl_file(xbrl_file.name)
+                'path': entry.path,
+                'name': entry.name,
+                'size': entry.stat().st_size,
+                'type': self._classify_xbrl_file(entry.name)
             }
             
             # インスタンス文書を優先
-            if 'instance' in xbrl_file.name.lower() or 'jpcrp' in xbrl_file.name:
+            if 'instance' in entry.name.lower() or 'jpcrp' in entry.name:
                 xbrl_files.insert(0, file_info)
             else:
                 xbrl_files.append(file_info)
@@ -364,24 +916,7 @@ class FinancialDataExtractor:
     
     def _classify_xbrl_file(self, filename: str) -> str:
         """XBRLファイルの種類を分類"""
-        filename_lower = filename.lower()
-        
-        if 'jpcrp' in filename_lower and 'instance' in filename_lower:
-            return "有価証券報告書インスタンス文書"
-        elif 'jpcrp' in filename_lower:
-            return "有価証券報告書関連"
-        elif 'jpdei' in filename_lower:
-            return "基本情報タクソノミ"
-        elif 'jpigp' in filename_lower:
-            return "業種別タクソノミ"
-        elif 'jppfs' in filename_lower:
-            return "財務諸表タクソノミ"
-        elif 'instance' in filename_lower:
-            return "インスタンス文書"
-        elif 'taxonomy' in filename_lower or 'tax' in filename_lower:
-            return "タクソノミファイル"
-        else:
-            return "その他XBRL文書"
+        return _classify_xbrl_filename(filename.lower())
     
     def extract_financial_data(self, xbrl_file_info: Dict[str, str]) -> Dict[str, Any]:
         """XBRLファイルから財務データを抽出"""
@@ -392,39 +927,23 @@ class FinancialDataExtractor:
         logger.info(f"XBRLファイル解析中: {file_name} ({file_type})")
         
         try:
-            with open(xbrl_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            soup = BeautifulSoup(content, 'xml')
+            item_texts, period_info = self._parse_xbrl_elements(xbrl_path)
             
             extracted_data = {}
             found_count = 0
             
-            for item_key, mapping_info in self.financial_mapping.items():
-                value = self._find_element_value(soup, mapping_info['xbrl_patterns'])
+            for item_key, skeleton in self._item_skeletons.items():
+                item = skeleton.copy()
+                value = self._extract_numeric_value(item_texts.get(item_key))
                 
                 if value is not None:
-                    extracted_data[item_key] = {
-                        'value': value,
-                        'japanese_name': mapping_info['japanese_name'],
-                        'unit': mapping_info['unit'],
-                        'importance': mapping_info['importance'],
-                        'category': mapping_info['category']
-                    }
+                    item['value'] = value
                     found_count += 1
-                else:
-                    extracted_data[item_key] = {
-                        'value': None,
-                        'japanese_name': mapping_info['japanese_name'],
-                        'unit': mapping_info['unit'],
-                        'importance': mapping_info['importance'],
-                        'category': mapping_info['category']
-                    }
+                
+                extracted_data[item_key] = item
             
             logger.info(f"財務データ抽出完了: {found_count}/{len(self.financial_mapping)}項目")
             
-            period_info = self._extract_period_info(soup)
-            
             return {
                 'financial_data': extracted_data,
                 'period_info': period_info,
@@ -445,38 +964,78 @@ class FinancialDataExtractor:
             logger.error(f"XBRL解析エラー: {e}")
             return {}
     
-    def _find_element_value(self, soup: BeautifulSoup, patterns: List[str]) -> Optional[str]:
-        """XBRLエレメントの値を検索"""
-        for pattern in patterns:
-            elements = soup.find_all(pattern)
-            if elements:
-                return self._extract_numeric_value(elements[0])
-            
-            if ':' in pattern:
-                local_name = pattern.split(':')[-1]
-                elements = soup.find_all(lambda tag: tag.name and tag.name.endswith(local_name))
-                if elements:
-                    return self._extract_numeric_value(elements[0])
-            
-            elements = soup.find_all(lambda tag: tag.name and tag.name.lower() == pattern.lower())
-            if elements:
-                return self._extract_numeric_value(elements[0])
+    def _parse_xbrl_elements(self, xbrl_path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """XBRLファイルを1回走査し、財務項目ごとのテキストと期間情報を取得
         
-        return None
-    
-    def _extract_numeric_value(self, element) -> Optional[str]:
-        """エレメントから数値を抽出"""
-        if element is None:
-            return None
+        各ローカル名は最初に出現したエレメントのみを採用し、走査中に該当する項目へ振り分ける。
         
-        text = element.get_text(strip=True)
+        Returns:
+            (項目キー → テキストの辞書, 期間情報の辞書)
+        """
+        seen_names = set()
+        item_texts = {}
+        period_matches = {}
         
+        try:
+            # DOMを構築せず逐次解析し、処理済みのエレメントは破棄してメモリを抑える
+            for _, elem in etree.iterparse(xbrl_path, events=('end',), huge_tree=True):
+                local_name = elem.tag.rpartition('}')[2]
+                if local_name not in seen_names:
+                    seen_names.add(local_name)
+                    # 対象外のエレメントはテキストを取り出さない
+                    item_keys, patterns = self._element_targets(local_name)
+                    if item_keys or patterns:
+                        self._record_element_text((elem.text or '').strip(), item_keys, patterns,
+                                                  item_texts, period_matches)
+                
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+                    
+        except etree.XMLSyntaxError as e:
+            # lxmlで解析できない場合はBeautifulSoupで代替
+            logger.warning(f"lxmlでの解析に失敗したためBeautifulSoupで解析します: {e}")
+            with open(xbrl_path, 'r', encoding='utf-8') as f:
+                soup = BeautifulSoup(f.read(), 'xml')
+            
+            seen_names = set()
+            item_texts = {}
+            period_matches = {}
+            for tag in soup.find_all(True):
+                if tag.name not in seen_names:
+                    seen_names.add(tag.name)
+                    item_keys, patterns = self._element_targets(tag.name)
+                    if item_keys or patterns:
+                        self._record_element_text(tag.get_text(strip=True), item_keys, patterns,
+                                                  item_texts, period_matches)
+        
+        return item_texts, self._extract_period_info(period_matches)
+    
+    def _element_targets(self, local_name: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """ローカル名に該当する財務項目キーと期間パターンを取得"""
+        name_lower = local_name.lower()
+        return self._localname_to_items.get(name_lower, ()), _period_patterns_in(name_lower)
+    
+    def _record_element_text(self, text: str, item_keys, patterns,
+                             item_texts: Dict[str, str], period_matches: Dict[str, str]):
+        """エレメントのテキストを該当する財務項目と期間パターンに記録（先に記録された値を優先）"""
+        for item_key in item_keys:
+            item_texts.setdefault(item_key, text)
+        
+        for pattern in patterns:
+            period_matches.setdefault(pattern, text)
+    
+    def _extract_numeric_value(self, text: Optional[str]) -> Optional[str]:
+        """エレメントのテキストから数値を抽出"""
         if not text:
             return None
         
-        numeric_text = re.sub(r'[^\d.-]', '', text)
+        numeric_text = _NON_NUMERIC_RE.sub('', text)
         
         if numeric_text:
+            # 数字のみ（ASCII）の場合はfloat()による検証を省略し、それ以外は従来どおり検証
+            if numeric_text.isascii() and numeric_text.isdigit():
+                return numeric_text
             try:
                 float(numeric_text)
                 return numeric_text
@@ -485,21 +1044,14 @@ class FinancialDataExtractor:
         
         return text
     
-    def _extract_period_info(self, soup: BeautifulSoup) -> Dict[str, str]:
-        """期間情報を抽出"""
+    def _extract_period_info(self, period_matches: Dict[str, str]) -> Dict[str, str]:
+        """パターンごとの一致結果から、優先順に期間情報を決定"""
         period_info = {}
         
-        period_patterns = [
-            ('period_start', ['periodStart', 'PeriodStart', 'startDate']),
-            ('period_end', ['periodEnd', 'PeriodEnd', 'endDate']),
-            ('instant', ['instant', 'Instant'])
-        ]
-        
-        for key, patterns in period_patterns:
+        for key, patterns in _PERIOD_PATTERNS:
             for pattern in patterns:
-                elements = soup.find_all(lambda tag: tag.name and pattern.lower() in tag.name.lower())
-                if elements:
-                    period_info[key] = elements[0].get_text(strip=True)
+                if pattern in period_matches:
+                    period_info[key] = period_matches[pattern]
                     break
         
         return period_info
@@ -525,56 +1077,28 @@ class FinancialDataExtractor:
     
     def _classify_document_type(self, doc_info: Dict) -> str:
         """文書種別を分類"""
-        doc_description = doc_info.get('docDescription', '').lower()
+        # キーワードはすべて全角文字のため小文字化は不要
+        doc_description = doc_info.get('docDescription') or ''
         form_code = doc_info.get('formCode', '')
-        
-        # 有価証券報告書
-        if '有価証券報告書' in doc_description or form_code == '030000':
-            return '有価証券報告書'
-        # 四半期報告書
-        elif '四半期報告書' in doc_description or form_code in ['043000', '044000']:
-            return '四半期報告書'
-        # 半期報告書  
-        elif '半期報告書' in doc_description or form_code == '050000':
-            return '半期報告書'
-        # 臨時報告書
-        elif '臨時報告書' in doc_description or form_code == '070000':
-            return '臨時報告書'
-        # 有価証券届出書
-        elif '有価証券届出書' in doc_description:
-            return '有価証券届出書'
-        # 変更報告書
-        elif '変更報告書' in doc_description:
-            return '変更報告書'
-        # 訂正報告書
-        elif '訂正' in doc_description:
-            if '有価証券報告書' in doc_description:
-                return '有価証券報告書（訂正）'
-            elif '四半期報告書' in doc_description:
-                return '四半期報告書（訂正）'
-            elif '半期報告書' in doc_description:
-                return '半期報告書（訂正）'
-            else:
-                return '訂正報告書'
-        else:
-            # form_codeから推定
-            form_code_mapping = {
-                '010000': '届出書',
-                '020000': '目論見書',
-                '030000': '有価証券報告書',
-                '040000': '四半期報告書',
-                '050000': '半期報告書',
-                '060000': '臨時報告書',
-                '070000': '臨時報告書',
-                '080000': '親会社等状況報告書',
-                '090000': '自己株券買付状況報告書',
-                '100000': '変更報告書',
-                '110000': '訂正届出書',
-                '120000': '有価証券報告書',
-                '130000': '有価証券報告書（訂正）'
-            }
-            return form_code_mapping.get(form_code, 'その他書類')
+        return _classify_document(doc_description, form_code)
 
+    def _write_csv(self, csv_path, extracted_data: Dict, doc_date: str, doc_name: str) -> int:
+        """財務データをCSVに書き出し、書き出した行数を返す（データがなければ書き出さない）"""
+        financial_data = extracted_data.get('financial_data')
+        if not financial_data or not self._csv_item_rows:
+            return 0
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow(_CSV_COLUMNS)
+            writer.writerows(
+                (doc_date, doc_name, item_key, japanese_name,
+                 financial_data.get(item_key, {}).get('value'), unit, importance, category)
+                for item_key, japanese_name, unit, importance, category in self._csv_item_rows
+            )
+        
+        return len(self._csv_item_rows)
+    
     def save_extracted_data(self, extracted_data: Dict, company_info: Dict, doc_info: Dict) -> str:
         """抽出データを保存"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -591,32 +1115,13 @@ class FinancialDataExtractor:
         }
         
         json_file = f"{company_safe_name}_financial_data_{timestamp}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        
-        csv_data = []
-        if 'financial_data' in extracted_data:
-            for item_key, item_data in extracted_data['financial_data'].items():
-                csv_data.append({
-                    'date': doc_date,
-                    'doc_name': doc_name,
-                    'item_key': item_key,
-                    'japanese_name': item_data['japanese_name'],
-                    'value': item_data['value'],
-                    'unit': item_data['unit'],
-                    'importance': item_data['importance'],
-                    'category': item_data['category']
-                })
-        
-        if csv_data:
-            csv_file = f"{company_safe_name}_financial_data_{timestamp}.csv"
-            df = pd.DataFrame(csv_data)
-            # カラム順序を明示的に指定
-            column_order = ['date', 'doc_name', 'item_key', 'japanese_name', 'value', 'unit', 'importance', 'category']
-            df = df[column_order]
-            df.to_csv(csv_file, index=False, encoding='utf-8-sig')
-            
-            logger.info(f"CSV保存完了: {len(csv_data)}行のデータ")
+        _write_json(json_file, output_data)
+        
+        csv_file = f"{company_safe_name}_financial_data_{timestamp}.csv"
+        row_count = self._write_csv(csv_file, extracted_data, doc_date, doc_name)
+        
+        if row_count:
+            logger.info(f"CSV保存完了: {row_count}行のデータ")
         
         logger.info(f"抽出データを保存: {json_file}")
         return json_file
@@ -635,19 +1140,53 @@ class FinancialDataExtractor:
         
         return csv_dir, json_dir
     
-    def save_document_individual(self, extracted_data: Dict, company_info: Dict, doc_info: Dict) -> str:
-        """単一文書を個別ファイルとして保存（CSV/JSON別フォルダ）"""
-        # output/csvとoutput/jsonフォルダの確保
-        csv_dir, json_dir = self._ensure_output_directories()
+    def _iter_batch_rows(self, extracted_data: Dict, company_info: Dict, doc_info: Dict):
+        """集約ファイル用に、文書の財務データを1項目1行の辞書として生成"""
+        financial_data = extracted_data.get('financial_data') or {}
+        doc_date, doc_name = self._extract_document_date_and_name(doc_info)
+        sec_code = company_info.get('証券コード')
+        
+        document_fields = {
+            'edinet_code': company_info.get('EDINETコード'),
+            'sec_code': None if pd.isna(sec_code) else str(sec_code),
+            'doc_id': doc_info.get('docID'),
+            'doc_date': doc_date,
+            'doc_name': doc_name
+        }
         
+        for item_key, japanese_name, unit, importance, category in self._csv_item_rows:
+            yield {
+                **document_fields,
+                'item_key': item_key,
+                'japanese_name': japanese_name,
+                'value': financial_data.get(item_key, {}).get('value'),
+                'unit': unit,
+                'importance': importance,
+                'category': category
+            }
+    
+    def _iter_processed_batch_rows(self, processed_file: str, company_info: Dict, doc_info: Dict):
+        """処理済み文書の出力JSONから集約ファイル用の行を生成（読み込めない場合は行なし）"""
+        try:
+            extracted_data = _read_json(processed_file).get('extracted_data') or {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"処理済み出力の読み込みエラー: {processed_file} ({e})")
+            return
+        
+        yield from self._iter_batch_rows(extracted_data, company_info, doc_info)
+    
+    def _individual_base_filename(self, company_info: Dict, doc_date: str, doc_name: str) -> Tuple[str, str]:
+        """
+        個別ファイルのファイル名（拡張子なし）を生成
+        
+        Returns:
+            (企業名_証券コード_EDINETコード_書類種別_yyyymmdd, yyyymmdd)
+        """
         # 企業情報から安全なファイル名要素を生成
         company_name = company_info.get('提出者名', 'unknown').replace('株式会社', '').replace(' ', '').replace('　', '')[:10]
         securities_code = company_info.get('証券コード', 'nocode')
         edinet_code = company_info.get('EDINETコード', 'noedinet')
         
-        # 文書情報から日付と書類種別を取得
-        doc_date, doc_name = self._extract_document_date_and_name(doc_info)
-        
         # 日付をyyyymmdd形式に変換
         try:
             if doc_date and '-' in doc_date:
@@ -660,8 +1199,16 @@ class FinancialDataExtractor:
         # 書類種別をファイル名用に調整
         doc_name_safe = doc_name.replace('（', '').replace('）', '').replace('・', '').replace(' ', '')
         
-        # ファイル名生成: 企業名_証券コード_EDINETコード_書類種別_yyyymmdd
-        base_filename = f"{company_name}_{securities_code}_{edinet_code}_{doc_name_safe}_{date_str}"
+        return f"{company_name}_{securities_code}_{edinet_code}_{doc_name_safe}_{date_str}", date_str
+    
+    def save_document_individual(self, extracted_data: Dict, company_info: Dict, doc_info: Dict) -> str:
+        """単一文書を個別ファイルとして保存（CSV/JSON別フォルダ）"""
+        # output/csvとoutput/jsonフォルダの確保
+        csv_dir, json_dir = self._ensure_output_directories()
+        
+        # 文書情報から日付と書類種別を取得
+        doc_date, doc_name = self._extract_document_date_and_name(doc_info)
+        base_filename, date_str = self._individual_base_filename(company_info, doc_date, doc_name)
         
         # JSON保存（output/jsonフォルダ内）
         output_data = {
@@ -672,37 +1219,135 @@ class FinancialDataExtractor:
         }
         
         json_file_path = json_dir / f"{base_filename}.json"
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        _write_json(json_file_path, output_data)
+        with self._done_lock:
+            if self._output_json_names is not None:
+                self._output_json_names.add(json_file_path.name)
         
         # CSV保存（output/csvフォルダ内）
-        csv_data = []
-        if 'financial_data' in extracted_data:
-            for item_key, item_data in extracted_data['financial_data'].items():
-                csv_data.append({
-                    'date': doc_date,
-                    'doc_name': doc_name,
-                    'item_key': item_key,
-                    'japanese_name': item_data['japanese_name'],
-                    'value': item_data['value'],
-                    'unit': item_data['unit'],
-                    'importance': item_data['importance'],
-                    'category': item_data['category']
-                })
-        
-        if csv_data:
-            csv_file_path = csv_dir / f"{base_filename}.csv"
-            df = pd.DataFrame(csv_data)
-            # カラム順序を明示的に指定
-            column_order = ['date', 'doc_name', 'item_key', 'japanese_name', 'value', 'unit', 'importance', 'category']
-            df = df[column_order]
-            df.to_csv(csv_file_path, index=False, encoding='utf-8-sig')
-            
-            logger.info(f"個別CSV保存完了: {csv_file_path} ({len(csv_data)}行)")
+        csv_file_path = csv_dir / f"{base_filename}.csv"
+        row_count = self._write_csv(csv_file_path, extracted_data, doc_date, doc_name)
+        
+        if row_count:
+            logger.info(f"個別CSV保存完了: {csv_file_path} ({row_count}行)")
         
         logger.info(f"個別ファイル保存完了: output/csv/{base_filename}.csv と output/json/{base_filename}.json")
+        
+        if doc_info.get('docID'):
+            self._mark_document_done(doc_info['docID'], str(json_file_path))
+        
         return str(json_file_path)
     
+    def _submit_save(self, write_pool: ThreadPoolExecutor, pending_saves: Dict[str, Future],
+                     extracted_data: Dict, company_info: Dict, doc_info: Dict) -> Future:
+        """
+        個別ファイルの保存を書き込みスレッドへ依頼
+        
+        出力ファイル名は企業・書類種別・日付のみで決まるため、同名になる文書（同日の原本と訂正等）の
+        保存は依頼順に直列化し、同じファイルへの同時書き込みを防ぐ（後から依頼した文書で上書きされる）。
+        
+        Args:
+            write_pool: 書き込みスレッドのプール
+            pending_saves: 出力ファイル名（拡張子なし）→ 直前に依頼した保存のFuture（呼び出し側で1つを共有）
+            
+        Returns:
+            保存先JSONパスを返すFuture
+        """
+        doc_date, doc_name = self._extract_document_date_and_name(doc_info)
+        base_filename, _ = self._individual_base_filename(company_info, doc_date, doc_name)
+        
+        previous = pending_saves.get(base_filename)
+        if previous is not None and previous.done():
+            previous = None
+        
+        future = write_pool.submit(self._save_after, previous, extracted_data, company_info, doc_info)
+        pending_saves[base_filename] = future
+        
+        # 完了済みの保存は追跡不要のため、件数が増えたらまとめて除く
+        if len(pending_saves) > 1024:
+            for name in [name for name, f in pending_saves.items() if f.done()]:
+                del pending_saves[name]
+        
+        return future
+    
+    def _save_after(self, previous: Optional[Future], extracted_data: Dict,
+                    company_info: Dict, doc_info: Dict) -> str:
+        """同名ファイルへの直前の保存の完了を待ってから個別ファイルを保存（成否は問わない）"""
+        if previous is not None:
+            # 書き込みプールは依頼順に取り出すため、直前の保存は実行中か完了済みで待ち合わせは詰まらない
+            wait([previous])
+        return self.save_document_individual(extracted_data, company_info, doc_info)
+    
+    def _load_done_documents(self) -> Dict[str, str]:
+        """処理済み文書の記録を読み込み（docID → JSON出力パス）"""
+        done_documents = {}
+        try:
+            with open(self._done_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    doc_id, _, output_file = line.rstrip('\n').partition('\t')
+                    if doc_id and output_file:
+                        done_documents[doc_id] = output_file
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"処理済み記録の読み込みエラー: {self._done_path} ({e})")
+        
+        return done_documents
+    
+    def _mark_document_done(self, doc_id: str, output_file: str):
+        """文書を処理済みとして記録（追記のみ、書き込みスレッドから呼ばれるためロックで保護）"""
+        with self._done_lock:
+            self._done_documents[doc_id] = output_file
+            self._done_outputs.add(output_file)
+            try:
+                self._done_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._done_path, 'a', encoding='utf-8') as f:
+                    f.write(f"{doc_id}\t{output_file}\n")
+            except OSError as e:
+                logger.warning(f"処理済み記録の書き込みエラー: {self._done_path} ({e})")
+    
+    def _get_output_json_names(self) -> set:
+        """output/json内の既存ファイル名の集合を取得（初回のみフォルダを走査）"""
+        with self._done_lock:
+            if self._output_json_names is None:
+                try:
+                    with os.scandir(Path('output') / 'json') as it:
+                        self._output_json_names = {entry.name for entry in it if entry.name.endswith('.json')}
+                except FileNotFoundError:
+                    self._output_json_names = set()
+            return self._output_json_names
+    
+    def _get_processed_output(self, company_info: Dict, doc_info: Dict) -> Optional[str]:
+        """
+        処理済みで出力ファイルが最新の文書なら、その出力パスを返す
+        
+        処理済み記録にない文書も、記録導入前の出力がoutput/jsonに残っていれば処理済みとみなす。
+        出力ファイルが提出日時より古い場合は再提出の可能性があるため未処理として扱う。
+        """
+        output_file = self._done_documents.get(doc_info.get('docID'))
+        
+        if not (output_file and os.path.exists(output_file)):
+            doc_date, doc_name = self._extract_document_date_and_name(doc_info)
+            base_filename, _ = self._individual_base_filename(company_info, doc_date, doc_name)
+            json_name = f"{base_filename}.json"
+            if json_name not in self._get_output_json_names():
+                return None
+            
+            output_file = str(Path('output') / 'json' / json_name)
+            # 別の文書の出力として記録済みのファイルは対象外
+            if output_file in self._done_outputs:
+                return None
+        
+        submit_datetime = doc_info.get('submitDateTime')
+        if submit_datetime:
+            try:
+                if os.path.getmtime(output_file) < datetime.fromisoformat(submit_datetime).timestamp():
+                    return None
+            except (ValueError, OSError):
+                pass
+        
+        return output_file
+    
     def process_company_document(self, company_info: Dict, doc_info: Dict) -> Optional[str]:
         """企業文書の処理（完全パイプライン）"""
         doc_id = doc_info['docID']
@@ -784,36 +1429,30 @@ class FinancialDataExtractor:
                 print(f"ファイルサイズ: {source_info.get('file_size', 0):,} bytes")
                 print(f"抽出日時: {source_info.get('extraction_datetime', '不明')}")
             
-            # 重要度別統計
-            importance_stats = {}
-            category_stats = {}
+            # 重要度別・カテゴリ別統計（1回の走査で集計）
+            importance_total = Counter()
+            importance_found = Counter()
+            category_total = Counter()
+            category_found = Counter()
             successful_items = []
             
-            for item_key, item_data in financial_data.items():
+            for item_data in financial_data.values():
                 importance = item_data.get('importance', 'unknown')
-                if importance not in importance_stats:
-                    importance_stats[importance] = {'total': 0, 'found': 0}
-                importance_stats[importance]['total'] += 1
-                
                 category = item_data.get('category', 'unknown')
-                if category not in category_stats:
-                    category_stats[category] = {'total': 0, 'found': 0}
-                category_stats[category]['total'] += 1
+                importance_total[importance] += 1
+                category_total[category] += 1
                 
                 if item_data.get('value') is not None:
-                    importance_stats[importance]['found'] += 1
-                    category_stats[category]['found'] += 1
+                    importance_found[importance] += 1
+                    category_found[category] += 1
                     successful_items.append(item_data)
             
-            print(f"\n--- 重要度別抽出状況 ---")
-            for importance, stats in importance_stats.items():
-                rate = round(stats['found'] / stats['total'] * 100, 1) if stats['total'] > 0 else 0
-                print(f"{importance}: {stats['found']}/{stats['total']} ({rate}%)")
-            
-            print(f"\n--- カテゴリ別抽出状況 ---")
-            for category, stats in category_stats.items():
-                rate = round(stats['found'] / stats['total'] * 100, 1) if stats['total'] > 0 else 0
-                print(f"{category}: {stats['found']}/{stats['total']} ({rate}%)")
+            for title, total, found in (('重要度別', importance_total, importance_found),
+                                        ('カテゴリ別', category_total, category_found)):
+                print(f"\n--- {title}抽出状況 ---")
+                for key, count in total.items():
+                    rate = round(found[key] / count * 100, 1)
+                    print(f"{key}: {found[key]}/{count} ({rate}%)")
             
             if successful_items:
                 print(f"\n--- 抽出成功例（最初の10項目） ---")
@@ -836,34 +1475,14 @@ class FinancialDataExtractor:
         print(f"EDINETコード: {edinet_code}")
         
         try:
-            start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d').date()
+            start_dt = _parse_ymd(start_date)
+            end_dt = _parse_ymd(end_date)
         except ValueError as e:
             print(f"❌ 日付形式エラー: {e}")
             return []
         
         # 日付範囲での文書検索
-        all_documents = []
-        current_date = start_dt
-        
-        while current_date <= end_dt:
-            try:
-                print(f"検索中: {current_date}")
-                documents = self.client.get_documents_list(current_date)
-                securities_reports = self.client.filter_securities_reports(documents)
-                
-                # 対象企業の文書のみ抽出
-                for doc in securities_reports:
-                    if doc.get("edinetCode") == edinet_code:
-                        doc['search_date'] = str(current_date)  # 検索日を記録
-                        doc_name = self._classify_document_type(doc)
-                        all_documents.append(doc)
-                        print(f"  発見: {doc_name} - {doc.get('docDescription')} (提出: {doc.get('submitDateTime')})")
-                
-            except Exception as e:
-                print(f"  エラー: {e}")
-            
-            current_date += timedelta(days=1)
+        all_documents = self._scan_company_documents(edinet_code, start_dt, end_dt)
         
         print(f"\n合計 {len(all_documents)} 件の文書が見つかりました")
         
@@ -887,8 +1506,9 @@ class FinancialDataExtractor:
         
         return result_files
     
-    def process_date_range_individual(self, company_info: Dict, start_date: str, end_date: str) -> List[str]:
-        """日付範囲内の文書を個別ファイルで処理"""
+    def process_date_range_individual(self, company_info: Dict, start_date: str, end_date: str,
+                                      force: bool = False) -> List[str]:
+        """日付範囲内の文書を個別ファイルで処理（force=Trueで処理済み文書も再処理）"""
         edinet_code = company_info.get('EDINETコード')
         company_name = company_info.get('提出者名')
         
@@ -896,32 +1516,12 @@ class FinancialDataExtractor:
         logger.info(f"期間: {start_date} ～ {end_date}")
         
         # 日付範囲を設定
-        current_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
-        
-        all_documents = []
+        start_date_obj = _parse_ymd(start_date)
+        end_date_obj = _parse_ymd(end_date)
         
         print(f"\n--- 期間内文書検索: {start_date} ～ {end_date} ---")
         
-        while current_date <= end_date_obj:
-            print(f"検索中: {current_date}")
-            
-            try:
-                documents = self.client.get_documents_list(current_date)
-                securities_reports = self.client.filter_securities_reports(documents)
-                
-                # 対象企業の文書のみ抽出
-                for doc in securities_reports:
-                    if doc.get("edinetCode") == edinet_code:
-                        doc['search_date'] = str(current_date)  # 検索日を記録
-                        doc_name = self._classify_document_type(doc)
-                        all_documents.append(doc)
-                        print(f"  発見: {doc_name} - {doc.get('docDescription')} (提出: {doc.get('submitDateTime')})")
-                
-            except Exception as e:
-                print(f"  エラー: {e}")
-            
-            current_date += timedelta(days=1)
+        all_documents = self._scan_company_documents(edinet_code, start_date_obj, end_date_obj)
         
         print(f"\n合計 {len(all_documents)} 件の文書が見つかりました")
         
@@ -929,144 +1529,270 @@ class FinancialDataExtractor:
             print("対象期間に有価証券報告書が見つかりませんでした")
             return []
         
-        # 各文書を個別ファイルで処理
+        # 処理済みの文書を除き、残りの文書のダウンロード（スレッド）を並列に開始し、
+        # 完了順にメインファイルの解析（プロセス）へ渡す
+        # （保存の依頼と表示は文書順に行い、ファイル書き込みは次の文書の解析と並行させる）
         result_files = []
-        for i, doc in enumerate(all_documents, 1):
-            print(f"\n--- 文書 {i}/{len(all_documents)} の個別処理 ---")
-            print(f"文書: {doc.get('docDescription')}")
-            print(f"検索日: {doc.get('search_date')}")
+        write_futures = []
+        pending_saves: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as download_pool, \
+                self._open_parse_pool() as parse_pool, \
+                ThreadPoolExecutor(max_workers=WRITE_MAX_WORKERS) as write_pool:
+            processed_files = {}
+            download_futures = {}
+            for doc in all_documents:
+                processed_file = None if force else self._get_processed_output(company_info, doc)
+                if processed_file:
+                    processed_files[doc['docID']] = processed_file
+                else:
+                    future = download_pool.submit(self._download_xbrl_files, doc['docID'])
+                    download_futures[future] = doc['docID']
             
-            try:
-                # XBRLダウンロードと解析
-                doc_id = doc['docID']
-                extract_path = self.download_and_extract_xbrl(doc_id)
-                xbrl_files = self.find_xbrl_files(extract_path)
-                
-                if not xbrl_files:
-                    print("❌ XBRLファイルが見つかりませんでした")
+            # ダウンロード完了順に解析を依頼（ダウンロードスレッドは解析の完了を待たない）
+            downloaded_files = {}
+            parse_futures = {}
+            download_errors = {}
+            for future in as_completed(download_futures):
+                doc_id = download_futures[future]
+                try:
+                    xbrl_files = future.result()
+                except Exception as e:
+                    download_errors[doc_id] = e
                     continue
                 
-                # メインファイルを使用してデータ抽出
-                main_xbrl = xbrl_files[0]
-                extracted_data = self.extract_financial_data(main_xbrl)
+                downloaded_files[doc_id] = xbrl_files
+                if xbrl_files:
+                    parse_futures[doc_id] = parse_pool.submit(_parse_xbrl_in_worker, xbrl_files[0])
+            
+            # 各文書を個別ファイルで処理
+            for i, doc in enumerate(all_documents, 1):
+                print(f"\n--- 文書 {i}/{len(all_documents)} の個別処理 ---")
+                print(f"文書: {doc.get('docDescription')}")
+                print(f"検索日: {doc.get('search_date')}")
                 
-                if not extracted_data:
-                    print("❌ 財務データ抽出に失敗しました")
+                # 処理済みの文書はスキップ
+                processed_file = processed_files.get(doc['docID'])
+                if processed_file:
+                    result_files.append(processed_file)
+                    print(f"⏭️  処理済みのためスキップ: {processed_file}")
                     continue
                 
-                # 個別ファイルで保存
-                result_file = self.save_document_individual(extracted_data, company_info, doc)
-                result_files.append(result_file)
-                print(f"✅ 個別ファイル処理完了: {result_file}")
-                
-            except Exception as e:
-                print(f"❌ 処理失敗: {e}")
-                logger.error(f"文書処理エラー: {e}")
+                try:
+                    if doc['docID'] in download_errors:
+                        raise download_errors[doc['docID']]
+                    
+                    if not downloaded_files[doc['docID']]:
+                        print("❌ XBRLファイルが見つかりませんでした")
+                        continue
+                    
+                    # メインファイルからのデータ抽出の完了を待つ
+                    extracted_data = parse_futures[doc['docID']].result()
+                    
+                    if not extracted_data:
+                        print("❌ 財務データ抽出に失敗しました")
+                        continue
+                    
+                    # 個別ファイルで保存（書き込みスレッドへ依頼）
+                    write_futures.append(self._submit_save(
+                        write_pool, pending_saves, extracted_data, company_info, doc
+                    ))
+                    print("💾 個別ファイル保存中...")
+                    
+                except Exception as e:
+                    print(f"❌ 処理失敗: {e}")
+                    logger.error(f"文書処理エラー: {e}")
+            
+            # 書き込みの完了を待って結果を確定
+            for future in write_futures:
+                try:
+                    result_file = future.result()
+                    result_files.append(result_file)
+                    print(f"✅ 個別ファイル処理完了: {result_file}")
+                except Exception as e:
+                    print(f"❌ 保存失敗: {e}")
+                    logger.error(f"文書保存エラー: {e}")
         
         return result_files
     
-    def process_all_companies_in_period(self, start_date: str, end_date: str) -> List[str]:
-        """全銘柄の期間内文書を一括処理"""
+    def process_all_companies_in_period(self, start_date: str, end_date: str,
+                                        force: bool = False, quiet: bool = False) -> List[str]:
+        """全銘柄の期間内文書を一括処理（force=Trueで処理済み文書も再処理、quiet=Trueで文書ごとの進捗表示を省略）"""
         logger.info(f"=== 全銘柄一括処理開始 ===")
         logger.info(f"期間: {start_date} ～ {end_date}")
         
         # 日付範囲を設定
-        current_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-        end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
+        start_date_obj = _parse_ymd(start_date)
+        end_date_obj = _parse_ymd(end_date)
         
+        verbose = self.verbose and not quiet
         all_result_files = []
         processed_count = 0
+        skipped_count = 0
         error_count = 0
         
         print(f"\n--- 全銘柄期間内文書一括処理: {start_date} ～ {end_date} ---")
         print("※ この処理は非常に時間がかかります（数時間〜数日）")
         print("※ 11,075社 × 期間内文書数の処理が実行されます")
         
-        while current_date <= end_date_obj:
-            print(f"\n🔍 日付: {current_date} の文書検索中...")
+        # 文書一覧の取得とダウンロード（I/O待ち）はスレッド、XBRL解析（CPU処理）はプロセスで並列化
+        # 送信間隔はクライアントのレート制限に従う。個別ファイルの書き込みも別スレッドで後続の解析と並行させる
+        # 財務データの集約ファイルへは日ごとに追記する（スキップした処理済み文書も含める）
+        write_futures = []
+        pending_saves: Dict[str, Future] = {}
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_MAX_WORKERS) as download_pool, \
+                self._open_parse_pool() as parse_pool, \
+                ThreadPoolExecutor(max_workers=WRITE_MAX_WORKERS) as write_pool, \
+                _BatchWriter(Path('output')) as batch_writer:
             
-            try:
-                # その日の全文書を取得
-                documents = self.client.get_documents_list(current_date)
-                securities_reports = self.client.filter_securities_reports(documents)
+            for current_date, day_future in self._iter_day_fetches(start_date_obj, end_date_obj):
+                # 進捗表示は1日分をまとめて出力する（非表示時は文字列の組み立て自体を省き、エラーのみ表示）
+                lines = []
+                emit = lines.append
+                batch_rows = []
                 
-                print(f"  発見された文書数: {len(securities_reports)}件")
+                if verbose:
+                    emit(f"\n🔍 日付: {current_date} の文書検索中...")
                 
-                # 各文書を処理
-                for i, doc in enumerate(securities_reports, 1):
-                    edinet_code = doc.get("edinetCode")
-                    doc_description = doc.get("docDescription", "")
+                try:
+                    # その日の全文書を取得
+                    securities_reports = day_future.result()
                     
-                    print(f"  処理中 ({i}/{len(securities_reports)}): {doc_description[:50]}...")
+                    if verbose:
+                        emit(f"  発見された文書数: {len(securities_reports)}件")
                     
-                    try:
+                    # ダウンロード段階: 企業情報が見つかった文書のXBRLを並列取得
+                    download_futures = {}
+                    for doc in securities_reports:
+                        edinet_code = doc.get("edinetCode")
+                        
                         # EDINETコードから企業情報を取得
                         company_info = self._get_company_info_by_edinet_code(edinet_code)
                         if not company_info:
-                            print(f"    ❌ 企業情報が見つかりません: {edinet_code}")
+                            emit(f"    ❌ 企業情報が見つかりません: {edinet_code}")
                             error_count += 1
                             continue
                         
-                        # XBRLダウンロードと解析
-                        doc_id = doc['docID']
-                        extract_path = self.download_and_extract_xbrl(doc_id)
-                        xbrl_files = self.find_xbrl_files(extract_path)
-                        
-                        if not xbrl_files:
-                            print(f"    ❌ XBRLファイルが見つかりません")
-                            error_count += 1
+                        # 処理済みの文書はダウンロードせずにスキップ
+                        processed_file = None if force else self._get_processed_output(company_info, doc)
+                        if processed_file:
+                            all_result_files.append(processed_file)
+                            skipped_count += 1
+                            batch_rows.extend(self._iter_processed_batch_rows(processed_file, company_info, doc))
                             continue
                         
-                        # メインファイルを使用してデータ抽出
-                        main_xbrl = xbrl_files[0]
-                        extracted_data = self.extract_financial_data(main_xbrl)
+                        future = download_pool.submit(self._download_xbrl_files, doc['docID'])
+                        download_futures[future] = (doc, company_info)
+                    
+                    # 解析段階: ダウンロード完了順にメインファイルの解析をワーカープロセスへ渡す
+                    parse_futures = {}
+                    for future in as_completed(download_futures):
+                        doc, company_info = download_futures[future]
                         
-                        if not extracted_data:
-                            print(f"    ❌ 財務データ抽出に失敗")
+                        try:
+                            xbrl_files = future.result()
+                        except Exception as e:
+                            emit(f"    ❌ 処理エラー: {e}")
+                            logger.error(f"文書処理エラー: {e}")
                             error_count += 1
                             continue
                         
-                        # 個別ファイルで保存
-                        result_file = self.save_document_individual(extracted_data, company_info, doc)
-                        all_result_files.append(result_file)
-                        processed_count += 1
+                        if not xbrl_files:
+                            emit(f"    ❌ XBRLファイルが見つかりません: {doc.get('docDescription', '')[:50]}")
+                            error_count += 1
+                            continue
                         
-                        print(f"    ✅ 処理完了: {company_info.get('提出者名', 'unknown')}")
+                        parse_future = parse_pool.submit(_parse_xbrl_in_worker, xbrl_files[0])
+                        parse_futures[parse_future] = (doc, company_info)
+                    
+                    # 保存段階: 解析が完了した文書から個別ファイルで保存
+                    for i, future in enumerate(as_completed(parse_futures), 1):
+                        doc, company_info = parse_futures[future]
                         
-                    except Exception as e:
-                        print(f"    ❌ 処理エラー: {e}")
-                        logger.error(f"文書処理エラー: {e}")
-                        error_count += 1
+                        if verbose:
+                            emit(f"  処理中 ({i}/{len(parse_futures)}): {doc.get('docDescription', '')[:50]}...")
                         
-                    # APIレート制限対応
-                    import time
-                    time.sleep(1)
+                        try:
+                            extracted_data = future.result()
+                            
+                            if not extracted_data:
+                                emit(f"    ❌ 財務データ抽出に失敗")
+                                error_count += 1
+                                continue
+                            
+                            # 個別ファイルで保存（書き込みスレッドへ依頼し、成否は最後にまとめて集計）
+                            write_futures.append(self._submit_save(
+                                write_pool, pending_saves, extracted_data, company_info, doc
+                            ))
+                            batch_rows.extend(self._iter_batch_rows(extracted_data, company_info, doc))
+                            
+                            if verbose:
+                                emit(f"    ✅ 処理完了: {company_info.get('提出者名', 'unknown')}")
+                            
+                        except Exception as e:
+                            emit(f"    ❌ 処理エラー: {e}")
+                            logger.error(f"文書処理エラー: {e}")
+                            error_count += 1
+                    
+                except Exception as e:
+                    emit(f"  日付処理エラー: {e}")
+                    logger.error(f"日付処理エラー: {e}")
                 
+                finally:
+                    # その日の分を集約ファイルへ追記
+                    try:
+                        batch_writer.write(batch_rows)
+                    except Exception as e:
+                        emit(f"  集約ファイル書き込みエラー: {e}")
+                        logger.error(f"集約ファイル書き込みエラー: {e}")
+                    
+                    if lines:
+                        sys.stdout.write("\n".join(lines) + "\n")
+                        sys.stdout.flush()
+        
+        batch_path = batch_writer.path if batch_writer.row_count else None
+        
+        # 書き込みの完了を集計
+        for future in write_futures:
+            try:
+                all_result_files.append(future.result())
+                processed_count += 1
             except Exception as e:
-                print(f"  日付処理エラー: {e}")
-                logger.error(f"日付処理エラー: {e}")
-            
-            current_date += timedelta(days=1)
+                print(f"    ❌ 保存エラー: {e}")
+                logger.error(f"文書保存エラー: {e}")
+                error_count += 1
         
         print(f"\n=== 全銘柄一括処理完了 ===")
         print(f"処理成功: {processed_count}件")
+        print(f"処理済みスキップ: {skipped_count}件")
         print(f"処理失敗: {error_count}件")
         print(f"出力ファイル数: {len(all_result_files) * 2}件（CSV/JSON各{len(all_result_files)}件）")
         print(f"CSV出力フォルダ: ./output/csv/")
         print(f"JSON出力フォルダ: ./output/json/")
+        if batch_path:
+            print(f"集約ファイル: {batch_path}")
         
         return all_result_files
     
+    def _open_parse_pool(self) -> ProcessPoolExecutor:
+        """XBRL解析用のプロセスプールを作成（ワーカーには財務指標マッピングのみ渡す）"""
+        return ProcessPoolExecutor(
+            max_workers=PARSE_MAX_WORKERS,
+            mp_context=_PARSE_MP_CONTEXT,
+            initializer=_init_parse_worker,
+            initargs=(self._get_parse_state(),)
+        )
+    
+    def _download_xbrl_files(self, doc_id: str) -> List[Dict[str, str]]:
+        """XBRLをダウンロード・解凍してファイル一覧を取得（ダウンロード段階）"""
+        extract_path = self.download_and_extract_xbrl(doc_id)
+        return self.find_xbrl_files(extract_path)
+    
     def _get_company_info_by_edinet_code(self, edinet_code: str) -> Optional[Dict]:
         """EDINETコードから企業情報を取得"""
         if self.edinet_list_df is None:
             return None
         
-        results = self.edinet_list_df[self.edinet_list_df['EDINETコード'] == edinet_code]
-        if len(results) == 0:
-            return None
-        
-        return results.iloc[0].to_dict()
+        return self._edinet_index.get(edinet_code)
     
     def run_interactive_mode(self):
         """対話型メイン処理"""
@@ -1109,8 +1835,13 @@ class FinancialDataExtractor:
                         print("処理をキャンセルしました。")
                         continue
                     
+                    force_choice = input("処理済みの文書も再処理しますか？ (y/n): ").strip().lower()
+                    force = force_choice in ['y', 'yes', 'はい']
+                    quiet_choice = input("文書ごとの進捗表示を省略しますか？ (y/n): ").strip().lower()
+                    quiet = quiet_choice in ['y', 'yes', 'はい']
+                    
                     # 全銘柄一括処理実行
-                    result_files = self.process_all_companies_in_period(start_date, end_date)
+                    result_files = self.process_all_companies_in_period(start_date, end_date, force=force, quiet=quiet)
                     
                     if result_files:
                         print(f"\n🎉 全銘柄一括処理完了!")
@@ -1270,10 +2001,26 @@ class FinancialDataExtractor:
                     break
 
 
+# 解析ワーカープロセスごとに1回だけ初期化される抽出器
+_worker_extractor = None
+
+
+def _init_parse_worker(parse_state: Tuple[Dict, Dict, Dict]):
+    """解析ワーカーの初期化（解析専用の軽量モードで生成）"""
+    global _worker_extractor
+    _worker_extractor = FinancialDataExtractor(verbose=False, parse_state=parse_state)
+
+
+def _parse_xbrl_in_worker(xbrl_file_info: Dict[str, str]) -> Dict[str, Any]:
+    """ワーカープロセスでXBRLファイルから財務データを抽出"""
+    return _worker_extractor.extract_financial_data(xbrl_file_info)
+
+
 def main():
     """メイン処理"""
     try:
-        extractor = FinancialDataExtractor()
+        # --no-cache指定時は保存済みのXBRL ZIPを使わずに再ダウンロード
+        extractor = FinancialDataExtractor(use_xbrl_cache='--no-cache' not in sys.argv[1:])
         extractor.run_interactive_mode()
         
     except KeyboardInterrupt:
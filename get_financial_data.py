@@ -17,9 +17,6 @@ def get_financial_data():
         print("❌ 環境変数 EDINET_API_KEY を設定してください")
         return
     
-    # クライアント初期化
-    client = EdinetAPIClient(api_key)
-    
     # 取得期間（過去1週間）
     end_date = date.today()
     start_date = end_date - timedelta(days=7)
@@ -28,24 +25,24 @@ def get_financial_data():
     print("📡 文書メタデータを取得中...\n")
     
     all_documents = []
-    current_date = start_date
     
-    # 日付ごとに取得
-    while current_date <= end_date:
-        try:
-            documents = client.get_documents_list(current_date)
+    # クライアント初期化（接続を使い回し、終了時にセッションを閉じる）
+    with EdinetAPIClient(api_key) as client:
+        # 期間内の文書リストをまとめて取得（日ごとのリクエストは並列に発行）
+        day_to_docs, day_errors = client.get_documents_list_range(start_date, end_date)
+        
+        for current_date in sorted(day_to_docs.keys() | day_errors.keys()):
+            if current_date in day_errors:
+                print(f"❌ {current_date}: エラー - {day_errors[current_date]}")
+                continue
             
+            documents = day_to_docs[current_date]
             if documents:
                 # 有価証券報告書のみフィルタリング
                 securities = client.filter_securities_reports(documents)
                 if securities:
                     all_documents.extend(securities)
                     print(f"✅ {current_date}: {len(securities)}件の有価証券報告書")
-            
-        except Exception as e:
-            print(f"❌ {current_date}: エラー - {e}")
-        
-        current_date += timedelta(days=1)
     
     # 結果を保存
     if all_documents: